@@ -1,6 +1,8 @@
 """Slack Lists MCP Server Package."""
 
-from slack_lists_mcp.__main__ import main
+import importlib
+from typing import Any
+
 from slack_lists_mcp.builders import (
     ColumnBuilder,
     ItemBuilder,
@@ -30,7 +32,6 @@ from slack_lists_mcp.helpers import (
     make_user,
     make_vote,
 )
-from slack_lists_mcp.server import mcp
 
 __version__ = "0.1.0"
 __all__ = [
@@ -65,3 +66,19 @@ __all__ = [
     "make_canvas",
     "extract_text",
 ]
+
+# The server stack (fastmcp) is slow to import, so the entry points are
+# loaded on first access; importing helpers or the client stays cheap.
+_LAZY_ATTRS = {
+    "main": "slack_lists_mcp.__main__",
+    "mcp": "slack_lists_mcp.server",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import server entry points on first access."""
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
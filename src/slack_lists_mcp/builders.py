@@ -4,6 +4,7 @@ These utilities provide a fluent interface for constructing list schemas,
 column definitions, and items with proper formatting.
 """
 
+from dataclasses import dataclass
 from typing import Any, Self
 
 from slack_lists_mcp.helpers import (
@@ -42,9 +43,16 @@ SELECT_COLORS = frozenset({
 })
 
 
+@dataclass(frozen=True, slots=True)
 class SelectOption:
     """Helper for creating select column options.
 
+    Args:
+        key: Unique identifier for the option
+        value: Display text for the option
+        color: Color for the option (indigo, blue, cyan, pink, yellow,
+               green, gray, red, purple, orange, brown)
+
     Example:
         >>> options = [
         ...     SelectOption("todo", "To Do", "gray").build(),
@@ -54,23 +62,16 @@ class SelectOption:
 
     """
 
-    def __init__(self, key: str, value: str, color: str = "gray"):
-        """Create a select option.
+    key: str
+    value: str
+    color: str = "gray"
 
-        Args:
-            key: Unique identifier for the option
-            value: Display text for the option
-            color: Color for the option (indigo, blue, cyan, pink, yellow,
-                   green, gray, red, purple, orange, brown)
-
-        """
-        if color not in SELECT_COLORS:
+    def __post_init__(self) -> None:
+        """Validate the option color."""
+        if self.color not in SELECT_COLORS:
             raise ValueError(
-                f"Invalid color '{color}'. Valid colors: {', '.join(sorted(SELECT_COLORS))}"
+                f"Invalid color '{self.color}'. Valid colors: {', '.join(sorted(SELECT_COLORS))}"
             )
-        self.key = key
-        self.value = value
-        self.color = color
 
     def build(self) -> dict[str, str]:
         """Build the option dictionary."""
@@ -117,6 +118,22 @@ class ColumnBuilder:
         self._is_primary = False
         self._options: dict[str, Any] = {}
 
+    @classmethod
+    def text_primary(cls, key: str, name: str) -> dict[str, Any]:
+        """Build a primary text column definition directly.
+
+        Equivalent to ``ColumnBuilder(key, name).text().primary().build()``.
+
+        Args:
+            key: Unique key for the column
+            name: Display name for the column
+
+        Returns:
+            Column definition dictionary
+
+        """
+        return {"key": key, "name": name, "type": "text", "is_primary_column": True}
+
     def text(self) -> Self:
         """Set column type to text."""
         self._type = "text"
@@ -315,10 +332,9 @@ class SchemaBuilder:
             primary: Whether this is the primary column
 
         """
-        builder = ColumnBuilder(key, name).text()
         if primary:
-            builder.primary()
-        return self.add_column(builder)
+            return self.add_column(ColumnBuilder.text_primary(key, name))
+        return self.add_column(ColumnBuilder(key, name).text())
 
     def add_number(self, key: str, name: str) -> Self:
         """Add a number column."""
@@ -414,6 +430,17 @@ class ItemBuilder:
         """Initialize the item builder."""
         self._fields: list[dict[str, Any]] = []
 
+    def __copy__(self) -> Self:
+        """Return a builder that can be extended without changing this one.
+
+        Field dicts are shared with the original, so they must not be
+        modified in place.
+
+        """
+        clone = type(self)()
+        clone._fields = list(self._fields)
+        return clone
+
     def add_field(self, column_id: str, field_type: str, value: Any) -> Self:
         """Add a field with explicit type.
 
@@ -54,6 +54,22 @@ class Settings(BaseSettings):
         alias="SLACK_RETRY_COUNT",
     )
 
+    slack_bulk_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description=(
+            "Maximum IDs sent per request when granting or revoking access in bulk"
+        ),
+        alias="SLACK_BULK_BATCH_SIZE",
+    )
+
+    slack_bulk_concurrency: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum concurrent requests for bulk access operations (advanced)",
+        alias="SLACK_BULK_CONCURRENCY",
+    )
+
     # Development settings
     debug_mode: bool = Field(
         default=False,
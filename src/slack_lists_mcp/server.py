@@ -25,8 +25,16 @@ mcp = FastMCP(
     version=settings.mcp_server_version,
 )
 
-# Initialize Slack client
-slack_client = SlackListsClient()
+# Slack client, created on first use by get_client()
+slack_client: SlackListsClient | None = None
+
+
+def get_client() -> SlackListsClient:
+    """Get the shared Slack Lists client, creating it on first use."""
+    global slack_client
+    if slack_client is None:
+        slack_client = SlackListsClient()
+    return slack_client
 
 
 @mcp.tool
@@ -134,7 +142,7 @@ async def add_list_item(
                     f"Adding item to list {list_id} with {len(initial_fields or [])} fields",
                 )
 
-        result = await slack_client.add_item(
+        result = await get_client().add_item(
             list_id=list_id,
             initial_fields=initial_fields,
             duplicated_item_id=duplicated_item_id,
@@ -225,7 +233,7 @@ async def update_list_item(
         if ctx:
             await ctx.info(f"Updating items in list {list_id} with {len(cells)} cells")
 
-        result = await slack_client.update_item(
+        result = await get_client().update_item(
             list_id=list_id,
             cells=cells,
         )
@@ -275,7 +283,7 @@ async def delete_list_item(
         if ctx:
             await ctx.info(f"Deleting item {item_id} from list {list_id}")
 
-        await slack_client.delete_item(
+        await get_client().delete_item(
             list_id=list_id,
             item_id=item_id,
         )
@@ -338,7 +346,7 @@ async def delete_list_items(
         if ctx:
             await ctx.info(f"Deleting {len(item_ids)} items from list {list_id}")
 
-        result = await slack_client.delete_items(
+        result = await get_client().delete_items(
             list_id=list_id,
             item_ids=item_ids,
         )
@@ -396,7 +404,7 @@ async def get_list_item(
         if ctx:
             await ctx.info(f"Retrieving item {item_id} from list {list_id}")
 
-        result = await slack_client.get_item(
+        result = await get_client().get_item(
             list_id=list_id,
             item_id=item_id,
             include_is_subscribed=include_is_subscribed,
@@ -460,7 +468,7 @@ async def list_items(
             filter_desc = f" with {len(filters)} filters" if filters else ""
             await ctx.info(f"Listing items from list {list_id}{filter_desc}")
 
-        response = await slack_client.list_items(
+        response = await get_client().list_items(
             list_id=list_id,
             limit=limit or 20,
             cursor=cursor,
@@ -519,7 +527,7 @@ async def get_list_info(
         if ctx:
             await ctx.info(f"Retrieving information for list {list_id}")
 
-        result = await slack_client.get_list(list_id=list_id)
+        result = await get_client().get_list(list_id=list_id)
 
         if ctx:
             await ctx.info("Successfully retrieved list information")
@@ -568,7 +576,7 @@ async def get_list_structure(
             await ctx.info(f"Analyzing structure for list {list_id}")
 
         # Get list items to find any item ID, then use items.info to get schema
-        items_response = await slack_client.list_items(
+        items_response = await get_client().list_items(
             list_id=list_id,
             limit=1,  # We just need one item to get the schema
         )
@@ -579,7 +587,7 @@ async def get_list_structure(
             item_id = first_item.get("id")
 
             # Get item info which includes list metadata with schema
-            item_info_response = await slack_client.get_item(
+            item_info_response = await get_client().get_item(
                 list_id=list_id,
                 item_id=item_id,
             )
@@ -734,7 +742,7 @@ async def create_list(
             else:
                 await ctx.info(f"Creating list '{name or 'Unnamed'}'")
 
-        result = await slack_client.create_list(
+        result = await get_client().create_list(
             name=name,
             description=description,
             todo_mode=todo_mode,
@@ -806,7 +814,7 @@ async def update_list(
         if ctx:
             await ctx.info(f"Updating list {list_id}")
 
-        result = await slack_client.update_list(
+        result = await get_client().update_list(
             list_id=list_id,
             name=name,
             description=description,
@@ -856,7 +864,7 @@ async def delete_list(
         if ctx:
             await ctx.warning(f"Deleting list {list_id} - this cannot be undone!")
 
-        result = await slack_client.delete_list(list_id=list_id)
+        result = await get_client().delete_list(list_id=list_id)
 
         if ctx:
             await ctx.info(f"Successfully deleted list {list_id}")
@@ -928,7 +936,7 @@ async def set_list_access(
             target = f"{len(user_ids)} users" if user_ids else f"{len(channel_ids)} channels"
             await ctx.info(f"Setting {access_level} access for {target} on list {list_id}")
 
-        result = await slack_client.set_access(
+        result = await get_client().set_access(
             list_id=list_id,
             access_level=access_level,
             user_ids=user_ids,
@@ -997,7 +1005,7 @@ async def delete_list_access(
             target = f"{len(user_ids)} users" if user_ids else f"{len(channel_ids)} channels"
             await ctx.info(f"Revoking access for {target} from list {list_id}")
 
-        result = await slack_client.delete_access(
+        result = await get_client().delete_access(
             list_id=list_id,
             user_ids=user_ids,
             channel_ids=channel_ids,
@@ -1059,7 +1067,7 @@ async def start_list_export(
         if ctx:
             await ctx.info(f"Starting export for list {list_id}")
 
-        result = await slack_client.start_export(
+        result = await get_client().start_export(
             list_id=list_id,
             include_archived=include_archived,
         )
@@ -1120,7 +1128,7 @@ async def get_list_export_url(
         if ctx:
             await ctx.info(f"Getting export URL for job {job_id}")
 
-        result = await slack_client.get_export_url(
+        result = await get_client().get_export_url(
             list_id=list_id,
             job_id=job_id,
         )
@@ -1194,7 +1202,7 @@ async def wait_for_export(
         if ctx:
             await ctx.info(f"Waiting for export job {job_id} to complete...")
 
-        result = await slack_client.wait_for_export(
+        result = await get_client().wait_for_export(
             list_id=list_id,
             job_id=job_id,
             timeout=timeout,
@@ -1,17 +1,23 @@
 """Slack Lists API client implementation."""
 
 import asyncio
+import functools
 import logging
-from typing import Any
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, Concatenate, NamedTuple, ParamSpec, TypeVar
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from slack_lists_mcp.config import get_settings
+from slack_lists_mcp.helpers import make_rich_text
 from slack_lists_mcp.models import ErrorResponse
 
 logger = logging.getLogger(__name__)
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
 # Errors that should trigger a retry
 RETRYABLE_ERRORS = frozenset({
     "rate_limited",
@@ -20,6 +26,70 @@ RETRYABLE_ERRORS = frozenset({
     "request_timeout",
 })
 
+# Valid access levels for slackLists.access.set
+ACCESS_LEVELS = frozenset({"read", "write", "owner"})
+
+# Field types that expect array values per Slack API documentation
+ARRAY_FIELD_TYPES = (
+    "select",
+    "user",
+    "date",
+    "number",
+    "email",
+    "phone",
+    "attachment",
+    "message",
+    "rating",
+    "timestamp",
+    "channel",
+    "reference",
+    "vote",
+    "canvas",
+)
+
+# All supported value keys for item fields per Slack API documentation
+SUPPORTED_FIELD_TYPES = (
+    "text",  # Converted to rich_text by _normalize_fields
+    "rich_text",  # Rich text blocks
+    "user",  # Array of user IDs
+    "select",  # Array of option IDs
+    "checkbox",  # Boolean
+    "date",  # Array of date strings (YYYY-MM-DD)
+    "number",  # Array of numbers
+    "email",  # Array of email addresses
+    "phone",  # Array of phone numbers
+    "attachment",  # Array of file IDs
+    "link",  # Array of link objects
+    "message",  # Array of Slack message permalinks
+    "rating",  # Array of numeric ratings
+    "timestamp",  # Array of Unix timestamps
+    "channel",  # Array of channel IDs
+    "reference",  # Array of file references
+)
+
+# Keys read by _extract_field_value, in priority order
+FIELD_VALUE_KEYS = (
+    "checkbox",
+    "select",
+    "user",
+    "date",
+    "text",
+    "number",
+    "email",
+    "phone",
+    "attachment",
+    "link",
+    "message",
+    "rating",
+    "timestamp",
+    "channel",
+    "reference",
+    "vote",
+    "canvas",
+    "rich_text",
+    "value",
+)
+
 # Human-readable error messages for common Slack API errors
 ERROR_MESSAGES = {
     "invalid_arguments": "Invalid parameters provided. Check field formats and required values.",
@@ -49,6 +119,339 @@ ERROR_MESSAGES = {
 }
 
 
+class SlackListsError(SlackApiError):
+    """SlackApiError raised by SlackListsClient with a human-readable message.
+
+    Callers can catch SlackApiError (or this class) directly and inspect
+    error_response instead of parsing the message string.
+    """
+
+    def __init__(self, message: str, response: Any, error_response: ErrorResponse):
+        """Create the error.
+
+        Args:
+            message: Human-readable error message
+            response: The Slack API response that caused the error
+            error_response: Parsed error details from _handle_api_error
+
+        """
+        super().__init__(message, response)
+        self.message = message
+        self.error_response = error_response
+
+    def __str__(self) -> str:
+        """Return the human-readable message without the raw response dump."""
+        return self.message
+
+
+class SlackListsBatchError(SlackListsError):
+    """SlackListsError for a batched call where some batches failed.
+
+    Batches are independent requests, so the ones that succeeded stay
+    applied; succeeded_ids and failed_ids say which IDs landed where.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        response: Any,
+        error_response: ErrorResponse,
+        succeeded_ids: list[str],
+        failed_ids: list[str],
+    ):
+        """Create the error.
+
+        Args:
+            message: Human-readable error message
+            response: The response of the first failed batch, if any
+            error_response: Parsed error details of the first failed batch
+            succeeded_ids: IDs whose batch was applied
+            failed_ids: IDs whose batch failed
+
+        """
+        super().__init__(message, response, error_response)
+        self.succeeded_ids = succeeded_ids
+        self.failed_ids = failed_ids
+
+
+def _with_slack_error_handling(
+    action: str,
+) -> Callable[
+    [Callable[Concatenate["SlackListsClient", P], Awaitable[R]]],
+    Callable[Concatenate["SlackListsClient", P], Awaitable[R]],
+]:
+    """Apply the client's standard error handling to an API method.
+
+    SlackApiError is logged via _handle_api_error and re-raised as a
+    SlackListsError carrying the human-readable message, chained to the
+    original; a SlackListsError already raised by a helper passes through
+    unchanged, and any other exception is logged and re-raised unchanged.
+
+    Args:
+        action: Description used in the error message, e.g. "add item"
+
+    """
+
+    def decorator(
+        func: Callable[Concatenate["SlackListsClient", P], Awaitable[R]],
+    ) -> Callable[Concatenate["SlackListsClient", P], Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(
+            self: "SlackListsClient", *args: P.args, **kwargs: P.kwargs
+        ) -> R:
+            try:
+                return await func(self, *args, **kwargs)
+            except SlackListsError:
+                raise
+            except SlackApiError as e:
+                error_response = self._handle_api_error(e)
+                raise SlackListsError(
+                    f"Failed to {action}: {error_response.error}",
+                    e.response,
+                    error_response,
+                ) from e
+            except Exception as e:
+                logger.error(f"Unexpected error in {func.__name__}: {e}")
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+class CompiledCondition(NamedTuple):
+    """A single filter operator with its loop-invariant work precomputed.
+
+    Built once per filter pass so per-item checks don't repeat lowercasing
+    the search string or scanning the expected list.
+    """
+
+    operator: str
+    expected: Any
+    check: Callable[[Any, "CompiledCondition"], bool]
+    negate: bool = False
+    search_lower: str = ""
+    expected_set: frozenset | None = None
+
+
+def _value_equals(value: Any, condition: CompiledCondition) -> bool:
+    """Check if value equals the condition's expected value."""
+    expected = condition.expected
+    if isinstance(value, list) and len(value) == 1:
+        return value[0] == expected
+    return value == expected
+
+
+def _value_contains(value: Any, condition: CompiledCondition) -> bool:
+    """Check if value contains the condition's (lowercased) search string."""
+    if value is None:
+        return False
+    search = condition.search_lower
+    if isinstance(value, str):
+        return search in value.lower()
+    if isinstance(value, list):
+        return any(search in str(v).lower() for v in value)
+    return search in str(value).lower()
+
+
+def _value_in_list(value: Any, condition: CompiledCondition) -> bool:
+    """Check if value is in the condition's expected list."""
+    values = value if isinstance(value, list) else [value]
+    expected_set = condition.expected_set
+    for v in values:
+        if expected_set is not None:
+            try:
+                if v in expected_set:
+                    return True
+                continue
+            except TypeError:
+                # Unhashable value; fall back to an equality scan
+                pass
+        if v in condition.expected:
+            return True
+    return False
+
+
+# Supported filter operators -> (check, negate); unknown operators are ignored.
+# The check also decides what _compile_condition precomputes.
+FILTER_OPERATORS = {
+    "equals": (_value_equals, False),
+    "not_equals": (_value_equals, True),
+    "contains": (_value_contains, False),
+    "not_contains": (_value_contains, True),
+    "in": (_value_in_list, False),
+    "not_in": (_value_in_list, True),
+}
+
+
+class _ExportPoller:
+    """Shared polling loop for wait_for_export.
+
+    Concurrent waits register a future per export job, and a single
+    background task polls every pending job once per tick instead of each
+    caller running its own sleep/poll loop. Callers waiting on the same
+    job share each poll.
+    """
+
+    def __init__(self, client: "SlackListsClient"):
+        """Initialize the poller.
+
+        Args:
+            client: Client used to fetch export status
+
+        """
+        self._client = client
+        self._waiters: dict[tuple[str, str], list[asyncio.Future]] = {}
+        self._first_polls: dict[tuple[str, str], list[asyncio.Future]] = {}
+        self._intervals: dict[asyncio.Future, float] = {}
+        self._last_status: dict[tuple[str, str], str | None] = {}
+        self._poll_interval: float | None = None
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def wait(
+        self,
+        list_id: str,
+        job_id: str,
+        timeout: float,
+        poll_interval: float,
+    ) -> dict[str, Any]:
+        """Wait until the export job completes.
+
+        At least one status check always completes before the timeout is
+        enforced, so a short timeout still returns an already finished job.
+
+        Args:
+            list_id: The ID of the list
+            job_id: The job ID from start_export
+            timeout: Maximum time to wait in seconds
+            poll_interval: Requested time between status checks; the shared
+                          loop uses the shortest interval among active waiters
+
+        Returns:
+            Export result with download_url
+
+        Raises:
+            TimeoutError: If the export doesn't complete within the timeout
+
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        key = (list_id, job_id)
+        future = loop.create_future()
+        first_poll = loop.create_future()
+        self._waiters.setdefault(key, []).append(future)
+        self._first_polls.setdefault(key, []).append(first_poll)
+        self._intervals[future] = poll_interval
+        if self._poll_interval is None or poll_interval < self._poll_interval:
+            self._poll_interval = poll_interval
+
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wake = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        else:
+            # Cut the current sleep short so this waiter gets its first poll now
+            self._wake.set()
+
+        try:
+            await asyncio.wait(
+                (future, first_poll), return_when=asyncio.FIRST_COMPLETED
+            )
+            if future.done():
+                return future.result()
+            remaining = max(timeout - (loop.time() - start), 0)
+            return await asyncio.wait_for(future, remaining)
+        except TimeoutError:
+            raise TimeoutError(
+                f"Export job {job_id} did not complete within {timeout} seconds. "
+                f"Last status: {self._last_status.get(key)}"
+            ) from None
+        finally:
+            self._discard(key, future, first_poll)
+
+    def _discard(
+        self,
+        key: tuple[str, str],
+        future: asyncio.Future,
+        first_poll: asyncio.Future,
+    ) -> None:
+        """Remove a finished or abandoned waiter."""
+        waiters = self._waiters.get(key)
+        if waiters and future in waiters:
+            waiters.remove(future)
+        if not waiters:
+            self._waiters.pop(key, None)
+            self._last_status.pop(key, None)
+        first_polls = self._first_polls.get(key)
+        if first_polls and first_poll in first_polls:
+            first_polls.remove(first_poll)
+        if not first_polls:
+            self._first_polls.pop(key, None)
+        first_poll.cancel()
+        self._intervals.pop(future, None)
+        self._poll_interval = min(self._intervals.values(), default=None)
+        if not self._waiters:
+            # Let the loop exit instead of finishing its sleep
+            self._wake.set()
+
+    def _resolve(
+        self,
+        key: tuple[str, str],
+        result: dict[str, Any] | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Complete every waiter for a job with a result or an error."""
+        for future in self._waiters.pop(key, []):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        self._last_status.pop(key, None)
+
+    async def _run(self) -> None:
+        """Poll all pending jobs once per tick until none remain."""
+        while self._waiters:
+            # Waiters that join from here on wake the next sleep early
+            self._wake.clear()
+            keys = list(self._waiters)
+            # Only waiters registered before this tick count it as their first poll
+            first_polls = [
+                first_poll
+                for key in keys
+                for first_poll in self._first_polls.pop(key, [])
+            ]
+            results = await asyncio.gather(
+                *(
+                    self._client.get_export_url(list_id=list_id, job_id=job_id)
+                    for list_id, job_id in keys
+                ),
+                return_exceptions=True,
+            )
+
+            for key, result in zip(keys, results, strict=True):
+                if key not in self._waiters:
+                    continue
+                if isinstance(result, BaseException):
+                    self._resolve(key, error=result)
+                elif result.get("status") == "completed" and result.get("download_url"):
+                    self._resolve(key, result=result)
+                else:
+                    self._last_status[key] = result.get("status")
+
+            for first_poll in first_polls:
+                if not first_poll.done():
+                    first_poll.set_result(None)
+
+            if not self._waiters:
+                break
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._poll_interval or 0)
+            except TimeoutError:
+                pass
+
+
 class SlackListsClient:
     """Client for interacting with Slack Lists API."""
 
@@ -66,7 +469,10 @@ class SlackListsClient:
             timeout=settings.slack_api_timeout,
         )
         self.retry_count = settings.slack_retry_count
+        self.bulk_batch_size = settings.slack_bulk_batch_size
+        self.bulk_concurrency = settings.slack_bulk_concurrency
         self._workspace_url: str | None = None
+        self._export_poller = _ExportPoller(self)
 
     def _get_workspace_url(self) -> str:
         """Get the workspace URL, fetching from Slack API on first call.
@@ -101,6 +507,27 @@ class SlackListsClient:
         workspace_url = self._get_workspace_url()
         return f"{workspace_url}/archives/{channel_id}/p{ts}"
 
+    def _normalize_link(self, link_value: Any) -> Any:
+        """Convert a link field value to a list of link objects.
+
+        Args:
+            link_value: URL string, link object, or a list mixing both
+
+        Returns:
+            List of link objects; other values are returned unchanged
+
+        """
+        if isinstance(link_value, str):
+            return [{"original_url": link_value}]
+        if isinstance(link_value, dict):
+            return [link_value]
+        if isinstance(link_value, list):
+            return [
+                {"original_url": item} if isinstance(item, str) else item
+                for item in link_value
+            ]
+        return link_value
+
     def _handle_api_error(self, e: SlackApiError) -> ErrorResponse:
         """Handle Slack API errors consistently.
 
@@ -154,7 +581,10 @@ class SlackListsClient:
 
         for attempt in range(self.retry_count + 1):
             try:
-                response = self.client.api_call(
+                # WebClient is synchronous; run it off the event loop so
+                # concurrent calls don't block each other
+                response = await asyncio.to_thread(
+                    self.client.api_call,
                     api_method=api_method,
                     json=json,
                 )
@@ -190,6 +620,89 @@ class SlackListsClient:
             raise last_exception
         raise RuntimeError("Unexpected retry loop exit")
 
+    async def _call_in_batches(
+        self,
+        action: str,
+        api_method: str,
+        json: dict[str, Any],
+        ids_key: str,
+        ids: list[str],
+    ) -> list[dict[str, Any]]:
+        """Execute an API call once per batch of IDs with bounded concurrency.
+
+        Splits ids into batches of bulk_batch_size and runs at most
+        bulk_concurrency requests at a time, so large grants take roughly
+        ceil(batches / concurrency) round trips instead of one per batch.
+        Every batch runs to completion even if another one fails.
+
+        Args:
+            action: Description used in the error message, e.g. "set access"
+            api_method: The Slack API method to call
+            json: The request payload shared by every batch
+            ids_key: Payload key that receives each batch of IDs
+            ids: The IDs to send
+
+        Returns:
+            The API responses, one per batch, in batch order
+
+        Raises:
+            SlackListsBatchError: If any batch failed, listing which IDs
+                were applied and which were not
+
+        """
+        batch_size = self.bulk_batch_size
+        batches = [ids[i : i + batch_size] for i in range(0, len(ids), batch_size)]
+        semaphore = asyncio.Semaphore(self.bulk_concurrency)
+
+        async def call_batch(batch: list[str]) -> dict[str, Any]:
+            async with semaphore:
+                response = await self._call_with_retry(
+                    api_method=api_method,
+                    json={**json, ids_key: batch},
+                )
+            if not response.get("ok"):
+                raise SlackApiError(message=f"Failed to {action}", response=response)
+            return response
+
+        if len(batches) > 1:
+            logger.debug(
+                f"Sending {len(ids)} {ids_key} to {api_method} in {len(batches)} batches",
+            )
+        results = await asyncio.gather(
+            *(call_batch(batch) for batch in batches),
+            return_exceptions=True,
+        )
+
+        responses: list[dict[str, Any]] = []
+        succeeded_ids: list[str] = []
+        failed_ids: list[str] = []
+        first_error: BaseException | None = None
+        for batch, result in zip(batches, results, strict=True):
+            if isinstance(result, BaseException):
+                failed_ids.extend(batch)
+                first_error = first_error or result
+            else:
+                responses.append(result)
+                succeeded_ids.extend(batch)
+        if first_error is None:
+            return responses
+
+        if isinstance(first_error, SlackApiError):
+            response = first_error.response
+            error_response = self._handle_api_error(first_error)
+        else:
+            response = None
+            error_response = ErrorResponse(error=str(first_error))
+        raise SlackListsBatchError(
+            f"Failed to {action}: {error_response.error} "
+            f"(succeeded: {', '.join(succeeded_ids) or 'none'}; "
+            f"failed: {', '.join(failed_ids)})",
+            response,
+            error_response,
+            succeeded_ids,
+            failed_ids,
+        ) from first_error
+
     def _normalize_fields(self, fields: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Normalize field formats for better API usability.
 
@@ -204,31 +717,13 @@ class SlackListsClient:
             Normalized field list
 
         """
-        # All field types that expect array values per Slack API documentation
-        array_field_types = [
-            "select",
-            "user",
-            "date",
-            "number",
-            "email",
-            "phone",
-            "attachment",
-            "message",
-            "rating",
-            "timestamp",
-            "channel",
-            "reference",
-            "vote",
-            "canvas",
-        ]
-
         normalized = []
         for field in fields:
             # Create a copy to avoid mutating the original
             normalized_field = field.copy()
 
             # Handle all array field types - wrap single values in array
-            for field_type in array_field_types:
+            for field_type in ARRAY_FIELD_TYPES:
                 if field_type in normalized_field and not isinstance(
                     normalized_field[field_type],
                     list,
@@ -239,36 +734,12 @@ class SlackListsClient:
             if "text" in normalized_field and "rich_text" not in normalized_field:
                 # Convert plain text to rich_text format
                 text_value = normalized_field.pop("text")
-                normalized_field["rich_text"] = [
-                    {
-                        "type": "rich_text",
-                        "elements": [
-                            {
-                                "type": "rich_text_section",
-                                "elements": [{"type": "text", "text": str(text_value)}],
-                            },
-                        ],
-                    },
-                ]
+                normalized_field["rich_text"] = make_rich_text(str(text_value))
 
             # Handle link fields - wrap strings in proper link object format
             if "link" in normalized_field:
                 link_value = normalized_field["link"]
-                # If it's a string URL, convert to link object
-                if isinstance(link_value, str):
-                    normalized_field["link"] = [{"original_url": link_value}]
-                # If it's a single dict, wrap in array
-                elif isinstance(link_value, dict):
-                    normalized_field["link"] = [link_value]
-                # If it's a list, ensure each element is properly formatted
-                elif isinstance(link_value, list):
-                    formatted_links = []
-                    for item in link_value:
-                        if isinstance(item, str):
-                            formatted_links.append({"original_url": item})
-                        else:
-                            formatted_links.append(item)
-                    normalized_field["link"] = formatted_links
+                normalized_field["link"] = self._normalize_link(link_value)
 
             # Handle message fields - convert structured objects to permalink URLs
             if "message" in normalized_field:
@@ -297,6 +768,7 @@ class SlackListsClient:
 
         return normalized
 
+    @_with_slack_error_handling("add item")
     async def add_item(
         self,
         list_id: str,
@@ -348,80 +820,54 @@ class SlackListsClient:
             parent_item_id = "Rec87654321"
 
         """
-        try:
-            # Either initial_fields or duplicated_item_id must be provided
-            if not initial_fields and not duplicated_item_id:
-                raise ValueError(
-                    "Either initial_fields or duplicated_item_id must be provided",
-                )
-
-            # Build request payload
-            request_data: dict[str, Any] = {"list_id": list_id}
-
-            # Add parent_item_id if creating a subtask
-            if parent_item_id:
-                request_data["parent_item_id"] = parent_item_id
+        # Either initial_fields or duplicated_item_id must be provided
+        if not initial_fields and not duplicated_item_id:
+            raise ValueError(
+                "Either initial_fields or duplicated_item_id must be provided",
+            )
 
-            # Handle duplication case
-            if duplicated_item_id:
-                request_data["duplicated_item_id"] = duplicated_item_id
-                logger.debug(f"Duplicating item {duplicated_item_id} in list {list_id}")
-            else:
-                # Validate and normalize fields only when not duplicating
-                for field in initial_fields or []:
-                    if "column_id" not in field:
-                        raise ValueError("Each field must have a 'column_id'")
-                    # All supported field types per Slack API documentation
-                    supported_field_types = [
-                        "text",  # Converted to rich_text by _normalize_fields
-                        "rich_text",  # Rich text blocks
-                        "user",  # Array of user IDs
-                        "select",  # Array of option IDs
-                        "checkbox",  # Boolean
-                        "date",  # Array of date strings (YYYY-MM-DD)
-                        "number",  # Array of numbers
-                        "email",  # Array of email addresses
-                        "phone",  # Array of phone numbers
-                        "attachment",  # Array of file IDs
-                        "link",  # Array of link objects
-                        "message",  # Array of Slack message permalinks
-                        "rating",  # Array of numeric ratings
-                        "timestamp",  # Array of Unix timestamps
-                        "channel",  # Array of channel IDs
-                        "reference",  # Array of file references
-                    ]
-                    if not any(key in field for key in supported_field_types):
-                        raise ValueError(
-                            f"Field with column_id '{field.get('column_id')}' must have a value. "
-                            f"Supported types: {', '.join(supported_field_types)}",
-                        )
-
-                # Normalize field formats for better usability
-                normalized_fields = self._normalize_fields(initial_fields or [])
-                request_data["initial_fields"] = normalized_fields
-                logger.debug(
-                    f"Creating item with {len(normalized_fields)} fields in list {list_id}",
-                )
+        # Build request payload
+        request_data: dict[str, Any] = {"list_id": list_id}
+
+        # Add parent_item_id if creating a subtask
+        if parent_item_id:
+            request_data["parent_item_id"] = parent_item_id
+
+        # Handle duplication case
+        if duplicated_item_id:
+            request_data["duplicated_item_id"] = duplicated_item_id
+            logger.debug(f"Duplicating item {duplicated_item_id} in list {list_id}")
+        else:
+            # Validate and normalize fields only when not duplicating
+            for field in initial_fields or []:
+                if "column_id" not in field:
+                    raise ValueError("Each field must have a 'column_id'")
+                if not any(key in field for key in SUPPORTED_FIELD_TYPES):
+                    raise ValueError(
+                        f"Field with column_id '{field.get('column_id')}' must have a value. "
+                        f"Supported types: {', '.join(SUPPORTED_FIELD_TYPES)}",
+                    )
 
-            response = await self._call_with_retry(
-                api_method="slackLists.items.create",
-                json=request_data,
+            # Normalize field formats for better usability
+            normalized_fields = self._normalize_fields(initial_fields or [])
+            request_data["initial_fields"] = normalized_fields
+            logger.debug(
+                f"Creating item with {len(normalized_fields)} fields in list {list_id}",
             )
 
-            if response.get("ok"):
-                return response.get("item", {})
-            raise SlackApiError(
-                message="Failed to add item",
-                response=response,
-            )
+        response = await self._call_with_retry(
+            api_method="slackLists.items.create",
+            json=request_data,
+        )
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to add item: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error adding item: {e}")
-            raise
+        if response.get("ok"):
+            return response.get("item", {})
+        raise SlackApiError(
+            message="Failed to add item",
+            response=response,
+        )
 
+    @_with_slack_error_handling("update items")
     async def update_item(
         self,
         list_id: str,
@@ -478,45 +924,38 @@ class SlackListsClient:
             ]
 
         """
-        try:
-            if not cells:
-                raise ValueError("At least one cell must be provided")
-
-            # Validate that each cell has either row_id or row_id_to_create
-            for cell in cells:
-                if "row_id" not in cell and not cell.get("row_id_to_create"):
-                    raise ValueError(
-                        "Each cell must have either 'row_id' or 'row_id_to_create: true'"
-                    )
+        if not cells:
+            raise ValueError("At least one cell must be provided")
 
-            # Normalize field formats for better usability
-            normalized_cells = self._normalize_fields(cells)
+        # Validate that each cell has either row_id or row_id_to_create
+        for cell in cells:
+            if "row_id" not in cell and not cell.get("row_id_to_create"):
+                raise ValueError(
+                    "Each cell must have either 'row_id' or 'row_id_to_create: true'"
+                )
 
-            logger.info(
-                f"Updating {len(normalized_cells)} cells in list {list_id}",
-            )
-            response = await self._call_with_retry(
-                api_method="slackLists.items.update",
-                json={
-                    "list_id": list_id,
-                    "cells": normalized_cells,
-                },
-            )
+        # Normalize field formats for better usability
+        normalized_cells = self._normalize_fields(cells)
 
-            if response.get("ok"):
-                return {"success": True}
-            raise SlackApiError(
-                message="Failed to update items",
-                response=response,
-            )
+        logger.info(
+            f"Updating {len(normalized_cells)} cells in list {list_id}",
+        )
+        response = await self._call_with_retry(
+            api_method="slackLists.items.update",
+            json={
+                "list_id": list_id,
+                "cells": normalized_cells,
+            },
+        )
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to update items: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error updating items: {e}")
-            raise
+        if response.get("ok"):
+            return {"success": True}
+        raise SlackApiError(
+            message="Failed to update items",
+            response=response,
+        )
 
+    @_with_slack_error_handling("delete item")
     async def delete_item(
         self,
         list_id: str,
@@ -532,29 +971,22 @@ class SlackListsClient:
             Confirmation of deletion
 
         """
-        try:
-            response = await self._call_with_retry(
-                api_method="slackLists.items.delete",
-                json={
-                    "list_id": list_id,
-                    "id": item_id,  # API expects 'id' not 'item_id'
-                },
-            )
-
-            if response.get("ok"):
-                return {"deleted": True, "item_id": item_id}
-            raise SlackApiError(
-                message="Failed to delete item",
-                response=response,
-            )
+        response = await self._call_with_retry(
+            api_method="slackLists.items.delete",
+            json={
+                "list_id": list_id,
+                "id": item_id,  # API expects 'id' not 'item_id'
+            },
+        )
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to delete item: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error deleting item: {e}")
-            raise
+        if response.get("ok"):
+            return {"deleted": True, "item_id": item_id}
+        raise SlackApiError(
+            message="Failed to delete item",
+            response=response,
+        )
 
+    @_with_slack_error_handling("delete items")
     async def delete_items(
         self,
         list_id: str,
@@ -570,32 +1002,25 @@ class SlackListsClient:
             Confirmation of deletion with count
 
         """
-        try:
-            if not item_ids:
-                raise ValueError("At least one item ID must be provided")
-
-            response = await self._call_with_retry(
-                api_method="slackLists.items.deleteMultiple",
-                json={
-                    "list_id": list_id,
-                    "ids": item_ids,
-                },
-            )
+        if not item_ids:
+            raise ValueError("At least one item ID must be provided")
 
-            if response.get("ok"):
-                return {"deleted": True, "count": len(item_ids), "item_ids": item_ids}
-            raise SlackApiError(
-                message="Failed to delete items",
-                response=response,
-            )
+        response = await self._call_with_retry(
+            api_method="slackLists.items.deleteMultiple",
+            json={
+                "list_id": list_id,
+                "ids": item_ids,
+            },
+        )
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to delete items: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error deleting items: {e}")
-            raise
+        if response.get("ok"):
+            return {"deleted": True, "count": len(item_ids), "item_ids": item_ids}
+        raise SlackApiError(
+            message="Failed to delete items",
+            response=response,
+        )
 
+    @_with_slack_error_handling("get item")
     async def get_item(
         self,
         list_id: str,
@@ -613,39 +1038,32 @@ class SlackListsClient:
             The item data including list metadata and subtasks if present
 
         """
-        try:
-            params = {
-                "list_id": list_id,
-                "id": item_id,  # API expects 'id' not 'item_id'
-            }
+        params = {
+            "list_id": list_id,
+            "id": item_id,  # API expects 'id' not 'item_id'
+        }
 
-            if include_is_subscribed:
-                params["include_is_subscribed"] = include_is_subscribed
+        if include_is_subscribed:
+            params["include_is_subscribed"] = include_is_subscribed
 
-            response = await self._call_with_retry(
-                api_method="slackLists.items.info",
-                json=params,
-            )
-
-            if response.get("ok"):
-                # API returns 'record' not 'item'
-                return {
-                    "item": response.get("record", {}),
-                    "list": response.get("list", {}),
-                    "subtasks": response.get("subtasks", []),
-                }
-            raise SlackApiError(
-                message="Failed to get item",
-                response=response,
-            )
+        response = await self._call_with_retry(
+            api_method="slackLists.items.info",
+            json=params,
+        )
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to get item: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error getting item: {e}")
-            raise
+        if response.get("ok"):
+            # API returns 'record' not 'item'
+            return {
+                "item": response.get("record", {}),
+                "list": response.get("list", {}),
+                "subtasks": response.get("subtasks", []),
+            }
+        raise SlackApiError(
+            message="Failed to get item",
+            response=response,
+        )
 
+    @_with_slack_error_handling("list items")
     async def list_items(
         self,
         list_id: str,
@@ -669,65 +1087,63 @@ class SlackListsClient:
                         "Col09H0PTP23Z": {"in": ["U123", "U456"]},  # 担当者リスト
                     }
                     Supported operators: equals, not_equals, contains, not_contains, in, not_in
+                    With filters, further pages are fetched until limit items match.
 
         Returns:
             Dictionary with items and pagination info
 
         """
-        try:
-            # API parameters (only supported ones)
-            params = {
-                "list_id": list_id,
-                "limit": limit * 3 if filters else limit,  # Get more items if filtering
-            }
+        # API parameters (only supported ones)
+        params = {"list_id": list_id, "limit": limit}
+        if archived is not None:
+            params["archived"] = archived
 
-            if cursor:
-                params["cursor"] = cursor
-            if archived is not None:
-                params["archived"] = archived
+        # Compile conditions once for every page fetched below
+        compiled_filters = self._compile_filters(filters) if filters else None
+        items: list[dict[str, Any]] = []
 
+        while True:
+            page_params = {**params, "cursor": cursor} if cursor else params
             response = await self._call_with_retry(
                 api_method="slackLists.items.list",
-                json=params,
+                json=page_params,
             )
 
-            if response.get("ok"):
-                items = response.get("items", [])
-
-                # Apply client-side filters if provided
-                if filters:
-                    filtered_items = []
-                    for item in items:
-                        if self._matches_filters(item, filters):
-                            filtered_items.append(item)
-                            if len(filtered_items) >= limit:
-                                break
-                    items = filtered_items
-
-                # Extract pagination info from response_metadata (Slack API standard)
-                response_metadata = response.get("response_metadata", {})
-                next_cursor = response_metadata.get("next_cursor", "")
-                # has_more is determined by whether next_cursor is non-empty
-                has_more = bool(next_cursor)
-
-                return {
-                    "items": items,
-                    "has_more": has_more,
-                    "next_cursor": next_cursor if next_cursor else None,
-                    "total": len(items),
-                }
+            if not response.get("ok"):
+                raise SlackApiError(
+                    message="Failed to list items",
+                    response=response,
+                )
 
-            raise SlackApiError(
-                message="Failed to list items",
-                response=response,
-            )
+            page_items = response.get("items", [])
+
+            # Extract pagination info from response_metadata (Slack API standard)
+            response_metadata = response.get("response_metadata", {})
+            next_cursor = response_metadata.get("next_cursor", "")
+
+            if compiled_filters is None:
+                items = page_items
+                break
+
+            # Apply client-side filters, following the cursor until enough
+            # items match instead of over-fetching a single page
+            for item in page_items:
+                if self._matches_filters(item, compiled_filters):
+                    items.append(item)
+                    if len(items) >= limit:
+                        break
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to list items: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error listing items: {e}")
-            raise
+            if len(items) >= limit or not next_cursor:
+                break
+            cursor = next_cursor
+
+        return {
+            "items": items,
+            # has_more is determined by whether next_cursor is non-empty
+            "has_more": bool(next_cursor),
+            "next_cursor": next_cursor if next_cursor else None,
+            "total": len(items),
+        }
 
     async def iter_all_items(
         self,
@@ -786,39 +1202,68 @@ class SlackListsClient:
             if not cursor:
                 break
 
+    def _compile_filters(
+        self,
+        filters: Mapping[str, dict[str, Any] | tuple[CompiledCondition, ...]],
+    ) -> tuple[tuple[str, tuple[CompiledCondition, ...]], ...]:
+        """Compile every filter condition into (filter key, conditions) pairs.
+
+        Args:
+            filters: Filter conditions keyed by column ID or key
+
+        Returns:
+            Compiled filters, ready to be reused across items
+
+        """
+        return tuple(
+            (
+                key,
+                self._compile_condition(condition)
+                if isinstance(condition, dict)
+                else condition,
+            )
+            for key, condition in filters.items()
+        )
+
     def _matches_filters(
         self,
         item: dict[str, Any],
-        filters: dict[str, dict[str, Any]],
+        filters: Mapping[str, dict[str, Any] | tuple[CompiledCondition, ...]]
+        | tuple[tuple[str, tuple[CompiledCondition, ...]], ...],
     ) -> bool:
         """Check if an item matches all filter conditions.
 
         Args:
             item: The item to check
-            filters: Filter conditions
+            filters: Filter conditions, raw or precompiled via _compile_filters
 
         Returns:
             True if item matches all filters, False otherwise
 
         """
-        fields = item.get("fields", [])
-
-        for filter_key, filter_condition in filters.items():
-            matched = False
-
-            # Find matching field
-            for field in fields:
-                # Match by column_id or key
-                if (
-                    field.get("column_id") == filter_key
-                    or field.get("key") == filter_key
-                ):
-                    field_value = self._extract_field_value(field)
-
-                    # Apply filter condition
-                    if self._apply_filter_condition(field_value, filter_condition):
-                        matched = True
-                        break
+        # Index fields by column_id and key once, instead of scanning every
+        # field for every filter
+        fields_by_ref: dict[str, list[dict[str, Any]]] = {}
+        for field in item.get("fields", []):
+            column_id = field.get("column_id")
+            key = field.get("key")
+            if column_id is not None:
+                fields_by_ref.setdefault(column_id, []).append(field)
+            if key is not None and key != column_id:
+                fields_by_ref.setdefault(key, []).append(field)
+
+        if isinstance(filters, Mapping):
+            filters = self._compile_filters(filters)
+
+        for filter_key, filter_condition in filters:
+            # Match by column_id or key; any matching field may satisfy the filter
+            matched = any(
+                self._apply_filter_condition(
+                    self._extract_field_value(field),
+                    filter_condition,
+                )
+                for field in fields_by_ref.get(filter_key, ())
+            )
 
             # If no field matched this filter, item doesn't match
             if not matched:
@@ -836,107 +1281,80 @@ class SlackListsClient:
             The extracted value
 
         """
-        # Priority order for value extraction
-        if "checkbox" in field:
-            return field["checkbox"]
-        if "select" in field:
-            return field["select"]
-        if "user" in field:
-            return field["user"]
-        if "date" in field:
-            return field["date"]
-        if "text" in field:
-            return field["text"]
-        if "number" in field:
-            return field["number"]
-        if "email" in field:
-            return field["email"]
-        if "phone" in field:
-            return field["phone"]
-        if "attachment" in field:
-            return field["attachment"]
-        if "link" in field:
-            return field["link"]
-        if "message" in field:
-            return field["message"]
-        if "rating" in field:
-            return field["rating"]
-        if "timestamp" in field:
-            return field["timestamp"]
-        if "channel" in field:
-            return field["channel"]
-        if "reference" in field:
-            return field["reference"]
-        if "vote" in field:
-            return field["vote"]
-        if "canvas" in field:
-            return field["canvas"]
-        if "rich_text" in field:
-            return field["rich_text"]
-        if "value" in field:
-            return field["value"]
+        for key in FIELD_VALUE_KEYS:
+            if key in field:
+                return field[key]
         return None
 
-    def _apply_filter_condition(self, value: Any, condition: dict[str, Any]) -> bool:
-        """Apply a filter condition to a value.
+    def _compile_condition(
+        self,
+        condition: dict[str, Any],
+    ) -> tuple[CompiledCondition, ...]:
+        """Precompute the invariant parts of a filter condition.
 
         Args:
-            value: The value to check
             condition: Filter condition with operator and expected value
 
         Returns:
-            True if value matches condition
+            One CompiledCondition per known operator in the condition
 
         """
+        compiled = []
         for operator, expected in condition.items():
-            if operator == "equals":
-                if not self._values_equal(value, expected):
-                    return False
-            elif operator == "not_equals":
-                if self._values_equal(value, expected):
-                    return False
-            elif operator == "contains":
-                if not self._value_contains(value, expected):
-                    return False
-            elif operator == "not_contains":
-                if self._value_contains(value, expected):
-                    return False
-            elif operator == "in":
-                if not self._value_in_list(value, expected):
-                    return False
-            elif operator == "not_in":
-                if self._value_in_list(value, expected):
-                    return False
+            if operator not in FILTER_OPERATORS:
+                continue
+            check, negate = FILTER_OPERATORS[operator]
+            search_lower = ""
+            expected_set = None
+            if check is _value_contains:
+                search_lower = str(expected).lower()
+            elif check is _value_in_list and isinstance(
+                expected, (list, tuple, set, frozenset)
+            ):
+                try:
+                    expected_set = frozenset(expected)
+                except TypeError:
+                    # Unhashable members (e.g. dicts) fall back to a list scan
+                    expected_set = None
+            compiled.append(
+                CompiledCondition(
+                    operator, expected, check, negate, search_lower, expected_set
+                )
+            )
+        return tuple(compiled)
 
-        return True
+    def _apply_filter_condition(
+        self,
+        value: Any,
+        condition: dict[str, Any] | tuple[CompiledCondition, ...],
+    ) -> bool:
+        """Apply a filter condition to a value.
+
+        Args:
+            value: The value to check
+            condition: Filter condition with operator and expected value,
+                      or its precompiled form from _compile_condition
+
+        Returns:
+            True if value matches condition
 
-    def _values_equal(self, value: Any, expected: Any) -> bool:
-        """Check if values are equal."""
-        if isinstance(value, list) and len(value) == 1:
-            return value[0] == expected
-        return value == expected
-
-    def _value_contains(self, value: Any, search: str) -> bool:
-        """Check if value contains search string."""
-        if value is None:
-            return False
-        if isinstance(value, str):
-            return search.lower() in value.lower()
-        if isinstance(value, list):
-            return any(search.lower() in str(v).lower() for v in value)
-        return search.lower() in str(value).lower()
-
-    def _value_in_list(self, value: Any, expected_list: list) -> bool:
-        """Check if value is in expected list."""
-        if isinstance(value, list):
-            return any(v in expected_list for v in value)
-        return value in expected_list
+        """
+        if isinstance(condition, dict):
+            condition = self._compile_condition(condition)
+
+        # Stops at the first failing condition
+        return all(
+            compiled.check(value, compiled) != compiled.negate
+            for compiled in condition
+        )
 
+    @_with_slack_error_handling("get list")
     async def get_list(self, list_id: str) -> dict[str, Any]:
         """Get information about a list.
 
         Note: There's no direct slackLists.info API, so we use items.list with limit=1
-        to get list metadata from the first item's response.
+        and return its list metadata if included, otherwise fetch it from the
+        first item's response.
 
         Args:
             list_id: The ID of the list
@@ -945,47 +1363,45 @@ class SlackListsClient:
             The list information
 
         """
-        try:
-            # Use list_items to get basic list info
-            response = await self._call_with_retry(
-                api_method="slackLists.items.list",
-                json={"list_id": list_id, "limit": 1},
-            )
-
-            if response.get("ok"):
-                # If we have items, try to get more detailed info
-                items = response.get("items", [])
-                if items:
-                    # Get first item info which includes list metadata
-                    item_response = await self._call_with_retry(
-                        api_method="slackLists.items.info",
-                        json={
-                            "list_id": list_id,
-                            "id": items[0]["id"],
-                        },
-                    )
-                    if item_response.get("ok"):
-                        return item_response.get("list", {})
-
-                # No items or couldn't get item info, return basic info
-                return {
-                    "id": list_id,
-                    "item_count": len(items),
-                    "message": "List metadata not available. List may be empty.",
-                }
+        # Use list_items to get basic list info
+        response = await self._call_with_retry(
+            api_method="slackLists.items.list",
+            json={"list_id": list_id, "limit": 1},
+        )
 
-            raise SlackApiError(
-                message="Failed to get list",
-                response=response,
-            )
+        if response.get("ok"):
+            # Use list metadata from the envelope when present to skip
+            # the second round trip
+            if response.get("list"):
+                return response["list"]
+
+            # If we have items, try to get more detailed info
+            items = response.get("items", [])
+            if items:
+                # Get first item info which includes list metadata
+                item_response = await self._call_with_retry(
+                    api_method="slackLists.items.info",
+                    json={
+                        "list_id": list_id,
+                        "id": items[0]["id"],
+                    },
+                )
+                if item_response.get("ok"):
+                    return item_response.get("list", {})
+
+            # No items or couldn't get item info, return basic info
+            return {
+                "id": list_id,
+                "item_count": len(items),
+                "message": "List metadata not available. List may be empty.",
+            }
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to get list: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error getting list: {e}")
-            raise
+        raise SlackApiError(
+            message="Failed to get list",
+            response=response,
+        )
 
+    @_with_slack_error_handling("create list")
     async def create_list(
         self,
         name: str | None = None,
@@ -1040,52 +1456,35 @@ class SlackListsClient:
             create_list(copy_from_list_id="F1234567890", include_copied_list_records=True)
 
         """
-        try:
-            list_data: dict[str, Any] = {}
-
-            if name:
-                list_data["name"] = name
-            if description:
-                # Convert plain text to description_blocks format
-                list_data["description_blocks"] = [
-                    {
-                        "type": "rich_text",
-                        "elements": [
-                            {
-                                "type": "rich_text_section",
-                                "elements": [{"type": "text", "text": description}],
-                            },
-                        ],
-                    },
-                ]
-            if todo_mode is not None:
-                list_data["todo_mode"] = todo_mode
-            if schema is not None:
-                list_data["schema"] = schema
-            if copy_from_list_id:
-                list_data["copy_from_list_id"] = copy_from_list_id
-            if include_copied_list_records is not None:
-                list_data["include_copied_list_records"] = include_copied_list_records
-
-            response = await self._call_with_retry(
-                api_method="slackLists.create",
-                json=list_data,
+        # Build the payload in one pass; empty name/copy_from_list_id are omitted
+        list_data: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("name", name or None),
+                ("todo_mode", todo_mode),
+                ("schema", schema),
+                ("copy_from_list_id", copy_from_list_id or None),
+                ("include_copied_list_records", include_copied_list_records),
             )
+            if value is not None
+        }
+        if description:
+            # Convert plain text to description_blocks format
+            list_data["description_blocks"] = make_rich_text(description)
 
-            if response.get("ok"):
-                return response.get("list", {})
-            raise SlackApiError(
-                message="Failed to create list",
-                response=response,
-            )
+        response = await self._call_with_retry(
+            api_method="slackLists.create",
+            json=list_data,
+        )
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to create list: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error creating list: {e}")
-            raise
+        if response.get("ok"):
+            return response.get("list", {})
+        raise SlackApiError(
+            message="Failed to create list",
+            response=response,
+        )
 
+    @_with_slack_error_handling("set access")
     async def set_access(
         self,
         list_id: str,
@@ -1108,47 +1507,37 @@ class SlackListsClient:
             - Cannot specify both user_ids and channel_ids in the same call
             - 'owner' access level only works with user_ids
             - Only the current owner can designate another user as owner
+            - More than bulk_batch_size IDs are sent as concurrent batches.
+              This is not atomic: if a batch fails the others still apply,
+              and the SlackListsBatchError lists succeeded and failed IDs
 
         """
-        try:
-            if not user_ids and not channel_ids:
-                raise ValueError("Either user_ids or channel_ids must be provided")
-            if user_ids and channel_ids:
-                raise ValueError("Cannot specify both user_ids and channel_ids")
-            if access_level not in ("read", "write", "owner"):
-                raise ValueError("access_level must be 'read', 'write', or 'owner'")
-            if access_level == "owner" and channel_ids:
-                raise ValueError("'owner' access level only works with user_ids")
-
-            request_data: dict[str, Any] = {
-                "list_id": list_id,
-                "access_level": access_level,
-            }
-
-            if user_ids:
-                request_data["user_ids"] = user_ids
-            if channel_ids:
-                request_data["channel_ids"] = channel_ids
-
-            response = await self._call_with_retry(
-                api_method="slackLists.access.set",
-                json=request_data,
-            )
+        if not user_ids and not channel_ids:
+            raise ValueError("Either user_ids or channel_ids must be provided")
+        if user_ids and channel_ids:
+            raise ValueError("Cannot specify both user_ids and channel_ids")
+        if access_level not in ACCESS_LEVELS:
+            raise ValueError("access_level must be 'read', 'write', or 'owner'")
+        if access_level == "owner" and channel_ids:
+            raise ValueError("'owner' access level only works with user_ids")
+
+        request_data: dict[str, Any] = {
+            "list_id": list_id,
+            "access_level": access_level,
+        }
 
-            if response.get("ok"):
-                return {"success": True}
-            raise SlackApiError(
-                message="Failed to set access",
-                response=response,
-            )
+        # Large grants are split into batches sent concurrently
+        await self._call_in_batches(
+            action="set access",
+            api_method="slackLists.access.set",
+            json=request_data,
+            ids_key="user_ids" if user_ids else "channel_ids",
+            ids=user_ids or channel_ids or [],
+        )
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to set access: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error setting access: {e}")
-            raise
+        return {"success": True}
 
+    @_with_slack_error_handling("delete access")
     async def delete_access(
         self,
         list_id: str,
@@ -1167,40 +1556,30 @@ class SlackListsClient:
 
         Note:
             Cannot specify both user_ids and channel_ids in the same call.
+            More than bulk_batch_size IDs are sent as concurrent batches.
+            This is not atomic: if a batch fails the others still apply, and
+            the SlackListsBatchError lists succeeded and failed IDs.
 
         """
-        try:
-            if not user_ids and not channel_ids:
-                raise ValueError("Either user_ids or channel_ids must be provided")
-            if user_ids and channel_ids:
-                raise ValueError("Cannot specify both user_ids and channel_ids")
-
-            request_data: dict[str, Any] = {"list_id": list_id}
-
-            if user_ids:
-                request_data["user_ids"] = user_ids
-            if channel_ids:
-                request_data["channel_ids"] = channel_ids
-
-            response = await self._call_with_retry(
-                api_method="slackLists.access.delete",
-                json=request_data,
-            )
-
-            if response.get("ok"):
-                return {"success": True}
-            raise SlackApiError(
-                message="Failed to delete access",
-                response=response,
-            )
+        if not user_ids and not channel_ids:
+            raise ValueError("Either user_ids or channel_ids must be provided")
+        if user_ids and channel_ids:
+            raise ValueError("Cannot specify both user_ids and channel_ids")
+
+        request_data: dict[str, Any] = {"list_id": list_id}
+
+        # Large revocations are split into batches sent concurrently
+        await self._call_in_batches(
+            action="delete access",
+            api_method="slackLists.access.delete",
+            json=request_data,
+            ids_key="user_ids" if user_ids else "channel_ids",
+            ids=user_ids or channel_ids or [],
+        )
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to delete access: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error deleting access: {e}")
-            raise
+        return {"success": True}
 
+    @_with_slack_error_handling("start export")
     async def start_export(
         self,
         list_id: str,
@@ -1220,35 +1599,28 @@ class SlackListsClient:
             to retrieve the download URL once the job completes.
 
         """
-        try:
-            request_data: dict[str, Any] = {"list_id": list_id}
+        request_data: dict[str, Any] = {"list_id": list_id}
 
-            if include_archived:
-                request_data["include_archived"] = include_archived
-
-            response = await self._call_with_retry(
-                api_method="slackLists.download.start",
-                json=request_data,
-            )
+        if include_archived:
+            request_data["include_archived"] = include_archived
 
-            if response.get("ok"):
-                return {
-                    "job_id": response.get("job_id"),
-                    "list_id": list_id,
-                    "status": "started",
-                }
-            raise SlackApiError(
-                message="Failed to start export",
-                response=response,
-            )
+        response = await self._call_with_retry(
+            api_method="slackLists.download.start",
+            json=request_data,
+        )
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to start export: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error starting export: {e}")
-            raise
+        if response.get("ok"):
+            return {
+                "job_id": response.get("job_id"),
+                "list_id": list_id,
+                "status": "started",
+            }
+        raise SlackApiError(
+            message="Failed to start export",
+            response=response,
+        )
 
+    @_with_slack_error_handling("get export URL")
     async def get_export_url(
         self,
         list_id: str,
@@ -1267,33 +1639,25 @@ class SlackListsClient:
             The export job may still be processing. If so, retry after a short delay.
 
         """
-        try:
-            response = await self._call_with_retry(
-                api_method="slackLists.download.get",
-                json={
-                    "list_id": list_id,
-                    "job_id": job_id,
-                },
-            )
-
-            if response.get("ok"):
-                return {
-                    "download_url": response.get("download_url"),
-                    "job_id": job_id,
-                    "list_id": list_id,
-                    "status": "completed" if response.get("download_url") else "processing",
-                }
-            raise SlackApiError(
-                message="Failed to get export URL",
-                response=response,
-            )
+        response = await self._call_with_retry(
+            api_method="slackLists.download.get",
+            json={
+                "list_id": list_id,
+                "job_id": job_id,
+            },
+        )
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to get export URL: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error getting export URL: {e}")
-            raise
+        if response.get("ok"):
+            return {
+                "download_url": response.get("download_url"),
+                "job_id": job_id,
+                "list_id": list_id,
+                "status": "completed" if response.get("download_url") else "processing",
+            }
+        raise SlackApiError(
+            message="Failed to get export URL",
+            response=response,
+        )
 
     async def wait_for_export(
         self,
@@ -1305,6 +1669,9 @@ class SlackListsClient:
         """Wait for an export job to complete and return the download URL.
 
         This method polls the export status until it's ready or times out.
+        Concurrent waits share a single polling loop, so waiting on many
+        exports at once makes one status request per job per tick.
+        At least one status check completes before the timeout applies.
 
         Args:
             list_id: The ID of the list
@@ -1330,27 +1697,14 @@ class SlackListsClient:
             print(export["download_url"])
 
         """
-        import time
-
-        start_time = time.time()
-
-        while True:
-            result = await self.get_export_url(list_id=list_id, job_id=job_id)
-
-            if result.get("status") == "completed" and result.get("download_url"):
-                return result
-
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                raise TimeoutError(
-                    f"Export job {job_id} did not complete within {timeout} seconds. "
-                    f"Last status: {result.get('status')}"
-                )
-
-            # Wait before next poll
-            await asyncio.sleep(poll_interval)
+        return await self._export_poller.wait(
+            list_id=list_id,
+            job_id=job_id,
+            timeout=timeout,
+            poll_interval=poll_interval,
+        )
 
+    @_with_slack_error_handling("update list")
     async def update_list(
         self,
         list_id: str,
@@ -1370,52 +1724,38 @@ class SlackListsClient:
             Success indicator
 
         """
-        try:
-            update_data: dict[str, Any] = {"id": list_id}
-
-            if name is not None:
-                update_data["name"] = name
-            if description is not None:
-                # Convert plain text to description_blocks format
-                update_data["description_blocks"] = [
-                    {
-                        "type": "rich_text",
-                        "elements": [
-                            {
-                                "type": "rich_text_section",
-                                "elements": [{"type": "text", "text": description}],
-                            },
-                        ],
-                    },
-                ]
-            if todo_mode is not None:
-                update_data["todo_mode"] = todo_mode
-
-            # Check if any update fields provided
-            if len(update_data) == 1:  # Only has 'id'
-                raise ValueError(
-                    "At least one of name, description, or todo_mode must be provided",
-                )
-
-            response = await self._call_with_retry(
-                api_method="slackLists.update",
-                json=update_data,
+        # Check before building any payload so the error path allocates nothing
+        if name is None and description is None and todo_mode is None:
+            raise ValueError(
+                "At least one of name, description, or todo_mode must be provided",
             )
 
-            if response.get("ok"):
-                return {"success": True}
-            raise SlackApiError(
-                message="Failed to update list",
-                response=response,
+        update_data: dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("id", list_id),
+                ("name", name),
+                ("todo_mode", todo_mode),
             )
+            if value is not None
+        }
+        if description is not None:
+            # Convert plain text to description_blocks format
+            update_data["description_blocks"] = make_rich_text(description)
 
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to update list: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error updating list: {e}")
-            raise
+        response = await self._call_with_retry(
+            api_method="slackLists.update",
+            json=update_data,
+        )
+
+        if response.get("ok"):
+            return {"success": True}
+        raise SlackApiError(
+            message="Failed to update list",
+            response=response,
+        )
 
+    @_with_slack_error_handling("delete list")
     async def delete_list(
         self,
         list_id: str,
@@ -1432,26 +1772,14 @@ class SlackListsClient:
             Confirmation of deletion
 
         """
-        try:
-            response = await self._call_with_retry(
-                api_method="slackLists.delete",
-                json={"id": list_id},
-            )
-
-            if response.get("ok"):
-                return {"deleted": True, "list_id": list_id}
-            raise SlackApiError(
-                message="Failed to delete list",
-                response=response,
-            )
-
-        except SlackApiError as e:
-            error_response = self._handle_api_error(e)
-            raise Exception(f"Failed to delete list: {error_response.error}")
-        except Exception as e:
-            logger.error(f"Unexpected error deleting list: {e}")
-            raise
-
+        response = await self._call_with_retry(
+            api_method="slackLists.delete",
+            json={"id": list_id},
+        )
 
-# Create a singleton instance
-slack_client = SlackListsClient()
+        if response.get("ok"):
+            return {"deleted": True, "list_id": list_id}
+        raise SlackApiError(
+            message="Failed to delete list",
+            response=response,
+        )
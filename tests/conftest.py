@@ -3,6 +3,8 @@
 import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -14,6 +16,41 @@ sys.path.insert(0, str(src_path))
 os.environ["SLACK_BOT_TOKEN"] = "test-token"
 os.environ["LOG_LEVEL"] = "DEBUG"
 
+# Preload the client and the helpers it uses once before test modules
+# are collected
+from slack_lists_mcp.slack_client import SlackListsClient
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _patch_webclient():
+    """Keep the real Slack WebClient out of every test session-wide."""
+    with patch("slack_lists_mcp.slack_client.WebClient") as mock:
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def mock_slack_client():
+    """Create a mock Slack client shared by every test in a module."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def client(mock_slack_client):
+    """Create a SlackListsClient wired to the module's shared mock."""
+    client = SlackListsClient()
+    client.client = mock_slack_client
+    return client
+
+
+@pytest.fixture
+def reset_client_state(mock_slack_client, client):
+    """Restore the shared mock and client between tests."""
+    mock_slack_client.reset_mock()
+    state = dict(vars(client))
+    yield
+    vars(client).clear()
+    vars(client).update(state)
+
 
 @pytest.fixture
 def mock_env(monkeypatch):
@@ -114,18 +151,20 @@ def sample_items():
     ]
 
 
-@pytest.fixture
-def rich_text_field():
-    """Sample rich text field structure."""
-    return {
-        "type": "rich_text",
-        "elements": [
-            {
-                "type": "rich_text_section",
-                "elements": [
-                    {"type": "text", "text": "Sample text"}
-                ],
-            }
-        ],
-    }
+_RICH_TEXT_FIELD = MappingProxyType({
+    "type": "rich_text",
+    "elements": (
+        MappingProxyType({
+            "type": "rich_text_section",
+            "elements": (
+                MappingProxyType({"type": "text", "text": "Sample text"}),
+            ),
+        }),
+    ),
+})
 
+
+@pytest.fixture(scope="session")
+def rich_text_field():
+    """Sample rich text field structure (read-only, shared by all tests)."""
+    return _RICH_TEXT_FIELD
@@ -1,14 +1,62 @@
 """Tests for the builder classes."""
 
+import copy
+import functools
+
 import pytest
 
 from slack_lists_mcp.builders import (
+    SELECT_COLORS,
     ColumnBuilder,
     ItemBuilder,
     SchemaBuilder,
     SelectOption,
     batch_create_items,
 )
+from slack_lists_mcp.helpers import extract_text
+
+pytestmark = pytest.mark.fast
+
+_VALID_COLORS = frozenset((
+    "indigo", "blue", "cyan", "pink", "yellow",
+    "green", "gray", "red", "purple", "orange", "brown",
+))
+
+_PROTO = ItemBuilder().text("Col1", "Task 1")
+
+
+def _plain_text(fields):
+    """Replace rich_text blocks with their plain text for comparison."""
+    return [
+        {**field, "rich_text": extract_text(field["rich_text"])}
+        if "rich_text" in field
+        else field
+        for field in fields
+    ]
+
+
+@functools.cache
+def _baseline_schema():
+    """Build a schema with one column of every type (read-only, shared)."""
+    return tuple(
+        SchemaBuilder()
+        .add_text("text", "Text", primary=True)
+        .add_number("num", "Number")
+        .add_date("date", "Date")
+        .add_user("user", "User")
+        .add_checkbox("check", "Checkbox")
+        .add_email("email", "Email")
+        .add_phone("phone", "Phone")
+        .add_link("link", "Link")
+        .add_attachment("attach", "Attachment")
+        .add_rating("rating", "Rating")
+        .add_channel("channel", "Channel")
+        .add_message("message", "Message")
+        .add_timestamp("ts", "Timestamp")
+        .add_vote("vote", "Vote")
+        .add_canvas("canvas", "Canvas")
+        .build()
+    )
 
 
 # Tests for SelectOption
@@ -24,6 +72,25 @@ def test_select_option_valid_color():
     assert result["color"] == "green"
 
 
+def test_select_option_is_frozen_value():
+    """Test equal SelectOptions compare, hash and build the same."""
+    option = SelectOption("done", "Done", "green")
+
+    assert option == SelectOption("done", "Done", "green")
+    assert {option: 1}[SelectOption("done", "Done", "green")] == 1
+    assert option.build() == SelectOption("done", "Done", "green").build()
+    with pytest.raises(AttributeError):
+        option.color = "red"
+
+
+def test_select_option_build_returns_fresh_dict():
+    """Test mutating a built option does not leak into later builds."""
+    column = ColumnBuilder("status", "Status").select([SelectOption("a", "A")])
+    column.build()["options"]["choices"][0]["color"] = "red"
+
+    assert SelectOption("a", "A").build() == {"key": "a", "value": "A", "color": "gray"}
+
+
 def test_select_option_default_color():
     """Test SelectOption with default gray color."""
     option = SelectOption("todo", "To Do")
@@ -41,11 +108,8 @@ def test_select_option_invalid_color():
 
 def test_select_option_all_colors():
     """Test all valid colors are accepted."""
-    valid_colors = [
-        "indigo", "blue", "cyan", "pink", "yellow",
-        "green", "gray", "red", "purple", "orange", "brown"
-    ]
-    for color in valid_colors:
+    assert _VALID_COLORS == SELECT_COLORS
+    for color in _VALID_COLORS:
         option = SelectOption("key", "value", color)
         assert option.build()["color"] == color
 
@@ -53,21 +117,82 @@ def test_select_option_all_colors():
 # Tests for ColumnBuilder
 
 
-def test_column_builder_text():
-    """Test building a text column."""
-    column = ColumnBuilder("task", "Task Name").text().build()
-
-    assert column["key"] == "task"
-    assert column["name"] == "Task Name"
-    assert column["type"] == "text"
+def test_column_builder_variants():
+    """Test building columns of each configurable type."""
+    cases = [
+        (
+            ColumnBuilder("task", "Task Name").text(),
+            {"key": "task", "name": "Task Name", "type": "text"},
+        ),
+        (
+            ColumnBuilder("name", "Name").text().primary(),
+            {"key": "name", "name": "Name", "type": "text", "is_primary_column": True},
+        ),
+        (
+            ColumnBuilder("status", "Status").select([
+                SelectOption("todo", "To Do", "gray"),
+                SelectOption("done", "Done", "green"),
+            ]),
+            {
+                "key": "status",
+                "name": "Status",
+                "type": "select",
+                "options": {
+                    "choices": [
+                        {"key": "todo", "value": "To Do", "color": "gray"},
+                        {"key": "done", "value": "Done", "color": "green"},
+                    ],
+                },
+            },
+        ),
+        (
+            ColumnBuilder("tags", "Tags").multi_select([
+                SelectOption("bug", "Bug", "red"),
+                SelectOption("feature", "Feature", "blue"),
+            ]),
+            {
+                "key": "tags",
+                "name": "Tags",
+                "type": "select",
+                "options": {
+                    "choices": [
+                        {"key": "bug", "value": "Bug", "color": "red"},
+                        {"key": "feature", "value": "Feature", "color": "blue"},
+                    ],
+                    "format": "multi_select",
+                },
+            },
+        ),
+        (
+            ColumnBuilder("due", "Due Date").date("MM/DD/YYYY"),
+            {
+                "key": "due",
+                "name": "Due Date",
+                "type": "date",
+                "options": {"format": "MM/DD/YYYY"},
+            },
+        ),
+        (
+            ColumnBuilder("assignees", "Assignees").user(multi=True),
+            {
+                "key": "assignees",
+                "name": "Assignees",
+                "type": "user",
+                "options": {"format": "multi_entity"},
+            },
+        ),
+    ]
 
+    for builder, expected in cases:
+        assert builder.build() == expected
 
-def test_column_builder_primary():
-    """Test building a primary text column."""
-    column = ColumnBuilder("name", "Name").text().primary().build()
 
-    assert column["is_primary_column"] is True
-    assert column["type"] == "text"
+def test_column_builder_text_primary():
+    """Test the direct primary text column form matches the fluent chain."""
+    assert (
+        ColumnBuilder.text_primary("name", "Name")
+        == ColumnBuilder("name", "Name").text().primary().build()
+    )
 
 
 def test_column_builder_primary_must_be_text():
@@ -77,53 +202,6 @@ def test_column_builder_primary_must_be_text():
     assert "Primary column must be text type" in str(exc_info.value)
 
 
-def test_column_builder_select_with_options():
-    """Test building a select column with options."""
-    column = (
-        ColumnBuilder("status", "Status")
-        .select([
-            SelectOption("todo", "To Do", "gray"),
-            SelectOption("done", "Done", "green"),
-        ])
-        .build()
-    )
-
-    assert column["type"] == "select"
-    assert len(column["options"]["choices"]) == 2
-    assert column["options"]["choices"][0]["key"] == "todo"
-
-
-def test_column_builder_multi_select():
-    """Test building a multi-select column."""
-    column = (
-        ColumnBuilder("tags", "Tags")
-        .multi_select([
-            SelectOption("bug", "Bug", "red"),
-            SelectOption("feature", "Feature", "blue"),
-        ])
-        .build()
-    )
-
-    assert column["type"] == "select"
-    assert column["options"]["format"] == "multi_select"
-
-
-def test_column_builder_date_with_format():
-    """Test building a date column with custom format."""
-    column = ColumnBuilder("due", "Due Date").date("MM/DD/YYYY").build()
-
-    assert column["type"] == "date"
-    assert column["options"]["format"] == "MM/DD/YYYY"
-
-
-def test_column_builder_user_multi():
-    """Test building a multi-user column."""
-    column = ColumnBuilder("assignees", "Assignees").user(multi=True).build()
-
-    assert column["type"] == "user"
-    assert column["options"]["format"] == "multi_entity"
-
-
 def test_column_builder_all_types():
     """Test all column types can be built."""
     types_to_test = [
@@ -192,7 +270,9 @@ def test_schema_builder_with_select():
 
 def test_schema_builder_only_one_primary():
     """Test that only one primary column is allowed."""
-    builder = SchemaBuilder().add_text("col1", "Column 1", primary=True)
+    builder = SchemaBuilder().add_column(
+        ColumnBuilder.text_primary("col1", "Column 1")
+    )
 
     with pytest.raises(ValueError) as exc_info:
         builder.add_text("col2", "Column 2", primary=True)
@@ -208,74 +288,79 @@ def test_schema_builder_empty_raises():
 
 def test_schema_builder_all_column_types():
     """Test adding all column types to schema."""
-    schema = (
-        SchemaBuilder()
-        .add_text("text", "Text", primary=True)
-        .add_number("num", "Number")
-        .add_date("date", "Date")
-        .add_user("user", "User")
-        .add_checkbox("check", "Checkbox")
-        .add_email("email", "Email")
-        .add_phone("phone", "Phone")
-        .add_link("link", "Link")
-        .add_attachment("attach", "Attachment")
-        .add_rating("rating", "Rating")
-        .add_channel("channel", "Channel")
-        .add_message("message", "Message")
-        .add_timestamp("ts", "Timestamp")
-        .add_vote("vote", "Vote")
-        .add_canvas("canvas", "Canvas")
-        .build()
-    )
+    schema = _baseline_schema()
 
     assert len(schema) == 15
+    assert schema[0]["is_primary_column"] is True
 
 
 def test_schema_builder_add_column_builder():
     """Test adding a ColumnBuilder to schema."""
     col = ColumnBuilder("custom", "Custom Column").text()
-    schema = SchemaBuilder().add_column(col).build()
+    schema = (
+        SchemaBuilder()
+        .add_column(ColumnBuilder.text_primary("name", "Name"))
+        .add_column(col)
+        .build()
+    )
 
-    assert len(schema) == 1
-    assert schema[0]["key"] == "custom"
+    assert len(schema) == 2
+    assert schema[0]["is_primary_column"] is True
+    assert schema[1]["key"] == "custom"
 
 
 # Tests for ItemBuilder
 
 
-def test_item_builder_text():
-    """Test building an item with text field."""
-    fields = ItemBuilder().text("Col123", "Hello World").build()
-
-    assert len(fields) == 1
-    assert fields[0]["column_id"] == "Col123"
-    assert "rich_text" in fields[0]
-
-
-def test_item_builder_multiple_fields():
-    """Test building an item with multiple fields."""
-    fields = (
-        ItemBuilder()
-        .text("Col1", "Task Name")
-        .user("Col2", "U123456")
-        .checkbox("Col3", True)
-        .date("Col4", "2024-12-31")
-        .build()
-    )
+def test_item_builder_variants():
+    """Test building items with single and multiple fields."""
+    cases = [
+        (
+            ItemBuilder().text("Col123", "Hello World"),
+            [{"column_id": "Col123", "rich_text": "Hello World"}],
+        ),
+        (
+            ItemBuilder()
+            .text("Col1", "Task Name")
+            .user("Col2", "U123456")
+            .checkbox("Col3", True)
+            .date("Col4", "2024-12-31"),
+            [
+                {"column_id": "Col1", "rich_text": "Task Name"},
+                {"column_id": "Col2", "user": ["U123456"]},
+                {"column_id": "Col3", "checkbox": True},
+                {"column_id": "Col4", "date": ["2024-12-31"]},
+            ],
+        ),
+        (
+            ItemBuilder().link("Col1", "https://example.com", "Example"),
+            [
+                {
+                    "column_id": "Col1",
+                    "link": [
+                        {
+                            "original_url": "https://example.com",
+                            "display_name": "Example",
+                            "display_as_url": False,
+                        },
+                    ],
+                },
+            ],
+        ),
+    ]
 
-    assert len(fields) == 4
-    assert fields[1]["user"] == ["U123456"]
-    assert fields[2]["checkbox"] is True
+    for builder, expected in cases:
+        assert _plain_text(builder.build()) == expected
 
 
-def test_item_builder_link_with_display_name():
-    """Test building an item with link and display name."""
-    fields = ItemBuilder().link("Col1", "https://example.com", "Example").build()
+def test_item_builder_copy():
+    """Test copied builders can be extended independently."""
+    clone = copy.copy(_PROTO).user("Col2", "U123")
 
-    assert len(fields) == 1
-    link = fields[0]["link"]
-    assert link[0]["original_url"] == "https://example.com"
-    assert link[0]["display_name"] == "Example"
+    assert len(clone.build()) == 2
+    assert _plain_text(_PROTO.build()) == [
+        {"column_id": "Col1", "rich_text": "Task 1"},
+    ]
 
 
 def test_item_builder_build_cells():
@@ -342,34 +427,28 @@ def test_item_builder_empty_raises():
 # Tests for batch_create_items
 
 
-def test_batch_create_items_with_builders():
-    """Test batch_create_items with ItemBuilder instances."""
-    cells = batch_create_items([
-        ItemBuilder().text("Col1", "Task 1"),
-        ItemBuilder().text("Col1", "Task 2"),
-    ])
-
-    assert len(cells) == 2
-    assert all(c.get("row_id_to_create") is True for c in cells)
-
-
-def test_batch_create_items_with_field_lists():
-    """Test batch_create_items with raw field lists."""
-    cells = batch_create_items([
-        [{"column_id": "Col1", "text": "Task 1"}],
-        [{"column_id": "Col1", "text": "Task 2"}],
-    ])
-
-    assert len(cells) == 2
-    assert all(c.get("row_id_to_create") is True for c in cells)
-
-
-def test_batch_create_items_mixed():
-    """Test batch_create_items with mixed input."""
-    cells = batch_create_items([
-        ItemBuilder().text("Col1", "Task 1").user("Col2", "U123"),
-        [{"column_id": "Col1", "text": "Task 2"}],
-    ])
+def test_batch_create_items():
+    """Test batch_create_items with builders, raw field lists and a mix."""
+    cases = [
+        ([copy.copy(_PROTO), copy.copy(_PROTO)], 2),
+        (
+            [
+                [{"column_id": "Col1", "text": "Task 1"}],
+                [{"column_id": "Col1", "text": "Task 2"}],
+            ],
+            2,
+        ),
+        # 2 fields from the builder + 1 from the raw list
+        (
+            [
+                ItemBuilder().text("Col1", "Task 1").user("Col2", "U123"),
+                [{"column_id": "Col1", "text": "Task 2"}],
+            ],
+            3,
+        ),
+    ]
 
-    assert len(cells) == 3  # 2 fields from first + 1 from second
-    assert all(c.get("row_id_to_create") is True for c in cells)
+    for items, expected_count in cases:
+        cells = batch_create_items(items)
+        assert len(cells) == expected_count
+        assert all(c.get("row_id_to_create") is True for c in cells)
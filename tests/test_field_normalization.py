@@ -1,49 +1,66 @@
 """Tests for field normalization functionality."""
 
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import MagicMock
 
 import pytest
 
-from slack_lists_mcp.slack_client import SlackListsClient
-
-
-@pytest.fixture
-def mock_slack_client():
-    """Create a mock Slack client."""
-    with patch("slack_lists_mcp.slack_client.WebClient") as mock:
-        mock_instance = MagicMock()
-        mock.return_value = mock_instance
-        yield mock_instance
+from slack_lists_mcp.helpers import extract_text
+
+pytestmark = pytest.mark.usefixtures("reset_client_state")
+
+
+# Static request payloads shared across tests; normalization copies each
+# field before changing it, so these are never mutated.
+_ADD_ITEM_FIELDS = (
+    # Plain text should be converted to rich_text
+    MappingProxyType({"column_id": "Col123", "text": "Plain text task"}),
+    # Single select and user values should be wrapped in arrays
+    MappingProxyType({"column_id": "Col456", "select": "OptABC"}),
+    MappingProxyType({"column_id": "Col789", "user": "U123"}),
+)
+
+_FORMATTED_FIELDS = (
+    MappingProxyType(
+        {
+            "column_id": "Col123",
+            "rich_text": [
+                {
+                    "type": "rich_text",
+                    "elements": [
+                        {
+                            "type": "rich_text_section",
+                            "elements": [{"type": "text", "text": "Already formatted"}],
+                        }
+                    ],
+                }
+            ],
+        }
+    ),
+    # Already arrays
+    MappingProxyType({"column_id": "Col456", "select": ["OptABC", "OptDEF"]}),
+    MappingProxyType({"column_id": "Col789", "user": ["U123", "U456"]}),
+)
+
+_CHECKBOX_FIELDS = (
+    # Boolean values should remain as-is
+    MappingProxyType({"column_id": "Col123", "checkbox": True}),
+    MappingProxyType({"column_id": "Col456", "checkbox": False}),
+)
+
+_MESSAGE_URL = "https://team.slack.com/archives/C03HDDKH82J/p1770618111689629"
 
 
 @pytest.mark.asyncio
-async def test_field_normalization_for_add_item(mock_slack_client):
+async def test_field_normalization_for_add_item(mock_slack_client, client):
     """Test field normalization when adding items."""
     mock_slack_client.api_call = MagicMock(
         return_value={"ok": True, "item": {"id": "Rec123"}},
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
-    # Test with plain text that should be converted to rich_text
-    # and select field as a single value that should be wrapped in array
     result = await client.add_item(
         list_id="F123",
-        initial_fields=[
-            {
-                "column_id": "Col123",
-                "text": "Plain text task",  # Should be converted to rich_text
-            },
-            {
-                "column_id": "Col456",
-                "select": "OptABC",  # Should be wrapped in array
-            },
-            {
-                "column_id": "Col789",
-                "user": "U123",  # Should be wrapped in array
-            },
-        ],
+        initial_fields=list(_ADD_ITEM_FIELDS),
     )
 
     assert result["id"] == "Rec123"
@@ -55,10 +72,7 @@ async def test_field_normalization_for_add_item(mock_slack_client):
     # Check text was converted to rich_text
     assert "rich_text" in normalized_fields[0]
     assert "text" not in normalized_fields[0]
-    assert (
-        normalized_fields[0]["rich_text"][0]["elements"][0]["elements"][0]["text"]
-        == "Plain text task"
-    )
+    assert extract_text(normalized_fields[0]["rich_text"]) == "Plain text task"
 
     # Check select was wrapped in array
     assert isinstance(normalized_fields[1]["select"], list)
@@ -70,15 +84,12 @@ async def test_field_normalization_for_add_item(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_field_normalization_for_update_item(mock_slack_client):
+async def test_field_normalization_for_update_item(mock_slack_client, client):
     """Test field normalization when updating items."""
     mock_slack_client.api_call = MagicMock(
         return_value={"ok": True},
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     # Test with plain text and single select value
     result = await client.update_item(
         list_id="F123",
@@ -105,10 +116,7 @@ async def test_field_normalization_for_update_item(mock_slack_client):
     # Check text was converted to rich_text
     assert "rich_text" in normalized_cells[0]
     assert "text" not in normalized_cells[0]
-    assert (
-        normalized_cells[0]["rich_text"][0]["elements"][0]["elements"][0]["text"]
-        == "Updated text"
-    )
+    assert extract_text(normalized_cells[0]["rich_text"]) == "Updated text"
 
     # Check select was wrapped in array
     assert isinstance(normalized_cells[1]["select"], list)
@@ -116,44 +124,15 @@ async def test_field_normalization_for_update_item(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_field_normalization_preserves_arrays(mock_slack_client):
+async def test_field_normalization_preserves_arrays(mock_slack_client, client):
     """Test that normalization doesn't modify fields already in correct format."""
     mock_slack_client.api_call = MagicMock(
         return_value={"ok": True, "item": {"id": "Rec123"}},
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
-    # Test with fields already in correct format
     result = await client.add_item(
         list_id="F123",
-        initial_fields=[
-            {
-                "column_id": "Col123",
-                "rich_text": [
-                    {
-                        "type": "rich_text",
-                        "elements": [
-                            {
-                                "type": "rich_text_section",
-                                "elements": [
-                                    {"type": "text", "text": "Already formatted"}
-                                ],
-                            }
-                        ],
-                    }
-                ],
-            },
-            {
-                "column_id": "Col456",
-                "select": ["OptABC", "OptDEF"],  # Already an array
-            },
-            {
-                "column_id": "Col789",
-                "user": ["U123", "U456"],  # Already an array
-            },
-        ],
+        initial_fields=list(_FORMATTED_FIELDS),
     )
 
     assert result["id"] == "Rec123"
@@ -163,10 +142,7 @@ async def test_field_normalization_preserves_arrays(mock_slack_client):
     normalized_fields = actual_call[1]["json"]["initial_fields"]
 
     # Rich text should remain unchanged
-    assert (
-        normalized_fields[0]["rich_text"][0]["elements"][0]["elements"][0]["text"]
-        == "Already formatted"
-    )
+    assert extract_text(normalized_fields[0]["rich_text"]) == "Already formatted"
 
     # Arrays should remain as arrays
     assert normalized_fields[1]["select"] == ["OptABC", "OptDEF"]
@@ -174,27 +150,15 @@ async def test_field_normalization_preserves_arrays(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_field_normalization_handles_checkbox(mock_slack_client):
+async def test_field_normalization_handles_checkbox(mock_slack_client, client):
     """Test that checkbox fields are not modified."""
     mock_slack_client.api_call = MagicMock(
         return_value={"ok": True, "item": {"id": "Rec123"}},
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.add_item(
         list_id="F123",
-        initial_fields=[
-            {
-                "column_id": "Col123",
-                "checkbox": True,  # Boolean values should remain as-is
-            },
-            {
-                "column_id": "Col456",
-                "checkbox": False,
-            },
-        ],
+        initial_fields=list(_CHECKBOX_FIELDS),
     )
 
     assert result["id"] == "Rec123"
@@ -208,21 +172,18 @@ async def test_field_normalization_handles_checkbox(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_message_field_url_string_wrapped(mock_slack_client):
+async def test_message_field_url_string_wrapped(mock_slack_client, client):
     """Test that a single message URL string is wrapped in an array."""
     mock_slack_client.api_call = MagicMock(
         return_value={"ok": True, "item": {"id": "Rec123"}},
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.add_item(
         list_id="F123",
         initial_fields=[
             {
                 "column_id": "Col123",
-                "message": "https://team.slack.com/archives/C03HDDKH82J/p1770618111689629",
+                "message": _MESSAGE_URL,
             },
         ],
     )
@@ -233,20 +194,15 @@ async def test_message_field_url_string_wrapped(mock_slack_client):
     normalized_fields = actual_call[1]["json"]["initial_fields"]
 
     assert isinstance(normalized_fields[0]["message"], list)
-    assert normalized_fields[0]["message"] == [
-        "https://team.slack.com/archives/C03HDDKH82J/p1770618111689629"
-    ]
+    assert normalized_fields[0]["message"] == [_MESSAGE_URL]
 
 
 @pytest.mark.asyncio
-async def test_message_field_structured_to_url(mock_slack_client):
+async def test_message_field_structured_to_url(mock_slack_client, client):
     """Test that structured message objects are converted to permalink URLs."""
     mock_slack_client.api_call = MagicMock(
         return_value={"ok": True, "item": {"id": "Rec123"}},
     )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
     # Pre-set workspace URL to avoid auth.test call
     client._workspace_url = "https://myteam.slack.com"
 
@@ -272,14 +228,11 @@ async def test_message_field_structured_to_url(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_message_field_array_mixed_conversion(mock_slack_client):
+async def test_message_field_array_mixed_conversion(mock_slack_client, client):
     """Test that mixed arrays of URLs and structured objects are all converted."""
     mock_slack_client.api_call = MagicMock(
         return_value={"ok": True, "item": {"id": "Rec123"}},
     )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
     client._workspace_url = "https://myteam.slack.com"
 
     result = await client.add_item(
@@ -307,22 +260,18 @@ async def test_message_field_array_mixed_conversion(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_message_field_url_array_preserved(mock_slack_client):
+async def test_message_field_url_array_preserved(mock_slack_client, client):
     """Test that a correctly formatted URL array is preserved as-is."""
     mock_slack_client.api_call = MagicMock(
         return_value={"ok": True, "item": {"id": "Rec123"}},
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
-    url = "https://team.slack.com/archives/C03HDDKH82J/p1770618111689629"
     result = await client.add_item(
         list_id="F123",
         initial_fields=[
             {
                 "column_id": "Col123",
-                "message": [url],
+                "message": [_MESSAGE_URL],
             },
         ],
     )
@@ -332,4 +281,4 @@ async def test_message_field_url_array_preserved(mock_slack_client):
     actual_call = mock_slack_client.api_call.call_args
     normalized_fields = actual_call[1]["json"]["initial_fields"]
 
-    assert normalized_fields[0]["message"] == [url]
+    assert normalized_fields[0]["message"] == [_MESSAGE_URL]
@@ -5,16 +5,24 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from fastmcp import Client
 
-from slack_lists_mcp.server import mcp
+from slack_lists_mcp.server import get_client, mcp
+from slack_lists_mcp.slack_client import SlackListsClient
 
 
-@pytest.mark.asyncio
-async def test_server_initialization():
+def test_server_initialization():
     """Test that the server initializes correctly."""
     assert mcp is not None
     assert mcp.name == "Slack Lists MCP Server"
 
 
+def test_get_client_is_lazy_singleton():
+    """Test the Slack client is created on first use and then reused."""
+    with patch("slack_lists_mcp.server.slack_client", None):
+        client = get_client()
+        assert isinstance(client, SlackListsClient)
+        assert get_client() is client
+
+
 @pytest.mark.asyncio
 async def test_get_list_structure_tool():
     """Test the get_list_structure tool."""
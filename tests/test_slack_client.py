@@ -1,73 +1,67 @@
 """Tests for the SlackListsClient."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import time
+from types import MappingProxyType
+from unittest.mock import MagicMock
 
 import pytest
 from slack_sdk.errors import SlackApiError
 
-from slack_lists_mcp.slack_client import SlackListsClient
+from slack_lists_mcp.helpers import make_rich_text
+from slack_lists_mcp.slack_client import SlackListsBatchError, SlackListsClient
 
+pytestmark = pytest.mark.usefixtures("reset_client_state")
 
-@pytest.fixture
-def mock_slack_client():
-    """Create a mock Slack client."""
-    with patch("slack_lists_mcp.slack_client.WebClient") as mock:
-        mock_instance = MagicMock()
-        mock.return_value = mock_instance
-        yield mock_instance
 
+class RecordingStub:
+    """Minimal api_call stand-in that records calls and returns canned responses.
 
-@pytest.mark.asyncio
-async def test_client_initialization(mock_slack_client):
-    """Test SlackListsClient initialization."""
-    with patch.dict("os.environ", {"SLACK_BOT_TOKEN": "test-token"}):
-        client = SlackListsClient()
-        assert client.client is not None
+    Pass a single ``response`` to return it on every call, or ``responses``
+    to return each one in turn.
 
+    """
 
-@pytest.mark.asyncio
-async def test_add_item(mock_slack_client):
-    """Test adding an item to a list."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "item": {
-                "id": "Rec123",
-                "list_id": "F123",
-                "fields": [
-                    {"column_id": "Col123", "text": "Test Item"},
-                ],
-            },
-        },
-    )
+    def __init__(self, response=None, *, responses=None):
+        self.calls = []
+        self._response = response
+        self._responses = iter(responses) if responses is not None else None
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if self._responses is not None:
+            return next(self._responses)
+        return self._response
 
-    result = await client.add_item(
-        list_id="F123",
-        initial_fields=[
-            {
-                "column_id": "Col123",
-                "rich_text": [
-                    {
-                        "type": "rich_text",
-                        "elements": [
-                            {
-                                "type": "rich_text_section",
-                                "elements": [{"type": "text", "text": "Test Item"}],
-                            },
-                        ],
-                    },
-                ],
-            },
-        ],
-    )
 
-    assert result["id"] == "Rec123"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.create",
-        json={
+class _Resp(dict):
+    """Plain-dict Slack response for SlackApiError, exposing itself as .data."""
+
+    @property
+    def data(self):
+        return self
+
+
+_OK_RESPONSE = MappingProxyType({"ok": True})
+
+_ADD_ITEM_RESPONSE = MappingProxyType(
+    {
+        "ok": True,
+        "item": {
+            "id": "Rec123",
+            "list_id": "F123",
+            "fields": [
+                {"column_id": "Col123", "text": "Test Item"},
+            ],
+        },
+    }
+)
+
+# Expected items.create call for test_add_item
+_ADD_ITEM_CALL = MappingProxyType(
+    {
+        "api_method": "slackLists.items.create",
+        "json": {
             "list_id": "F123",
             "initial_fields": [
                 {
@@ -86,18 +80,198 @@ async def test_add_item(mock_slack_client):
                 },
             ],
         },
-    )
+    }
+)
+
+_CREATED_ITEM_RESPONSE = MappingProxyType(
+    {
+        "ok": True,
+        "item": {
+            "id": "Rec456",
+            "list_id": "F123",
+        },
+    }
+)
+
+_FILTER_ITEMS_RESPONSE = MappingProxyType(
+    {
+        "ok": True,
+        "items": [
+            {
+                "id": "Rec1",
+                "fields": [
+                    {"key": "name", "text": "Test Item"},
+                    {"key": "status", "select": ["active"]},
+                ],
+            },
+            {
+                "id": "Rec2",
+                "fields": [
+                    {"key": "name", "text": "Another Item"},
+                    {"key": "status", "select": ["inactive"]},
+                ],
+            },
+        ],
+    }
+)
+
+_EXPORT_PENDING_RESPONSE = MappingProxyType({"ok": True, "download_url": None})
+
+_EXPORT_READY_RESPONSE = MappingProxyType(
+    {
+        "ok": True,
+        "download_url": "https://files.slack.com/export.csv",
+    }
+)
+
+FILTER_ITEM = {
+    "fields": [
+        {"key": "status", "select": ["active"]},
+        {"key": "name", "text": "Test Item"},
+    ],
+}
+
+# (case id, filters, whether FILTER_ITEM matches)
+FILTER_CASES = [
+    ("equals", {"status": {"equals": "active"}}, True),
+    ("equals_miss", {"status": {"equals": "inactive"}}, False),
+    ("contains", {"name": {"contains": "Test"}}, True),
+    ("contains_case_insensitive", {"name": {"contains": "test"}}, True),
+    ("contains_miss", {"name": {"contains": "Other"}}, False),
+    ("not_equals", {"status": {"not_equals": "inactive"}}, True),
+    ("not_equals_miss", {"status": {"not_equals": "active"}}, False),
+    ("not_contains", {"name": {"not_contains": "Other"}}, True),
+    ("not_contains_miss", {"name": {"not_contains": "Test"}}, False),
+    ("in", {"status": {"in": ["active", "pending"]}}, True),
+    ("in_miss", {"status": {"in": ["inactive", "pending"]}}, False),
+    ("not_in", {"status": {"not_in": ["inactive", "pending"]}}, True),
+    ("not_in_miss", {"status": {"not_in": ["active", "pending"]}}, False),
+    # Multiple filters use AND logic
+    (
+        "and",
+        {"status": {"equals": "active"}, "name": {"contains": "Test"}},
+        True,
+    ),
+    (
+        "and_miss",
+        {"status": {"equals": "active"}, "name": {"contains": "Other"}},
+        False,
+    ),
+]
+
+FIELD_VALUE_CASES = [
+    ({"checkbox": True}, True),
+    ({"select": ["option1"]}, ["option1"]),
+    ({"user": ["U123"]}, ["U123"]),
+    ({"date": ["2024-01-01"]}, ["2024-01-01"]),
+    ({"text": "Test Text"}, "Test Text"),
+    ({"number": [42]}, [42]),
+    ({"email": ["test@example.com"]}, ["test@example.com"]),
+    ({"phone": ["+1234567890"]}, ["+1234567890"]),
+    ({"attachment": ["F123"]}, ["F123"]),
+    (
+        {"link": [{"original_url": "https://example.com"}]},
+        [{"original_url": "https://example.com"}],
+    ),
+    ({"message": ["https://slack.com/p1"]}, ["https://slack.com/p1"]),
+    ({"rating": [4]}, [4]),
+    ({"timestamp": [1704067200]}, [1704067200]),
+    ({"channel": ["C123"]}, ["C123"]),
+    ({"reference": ["F456"]}, ["F456"]),
+    ({"vote": [3]}, [3]),
+    ({"canvas": ["F789"]}, ["F789"]),
+    ({"rich_text": [{"type": "rich_text"}]}, [{"type": "rich_text"}]),
+    # Earlier keys win when several are present
+    ({"checkbox": False, "text": "ignored"}, False),
+    ({"select": ["option1"], "rich_text": []}, ["option1"]),
+    # Falls back to the generic value key
+    ({"value": "fallback"}, "fallback"),
+    ({}, None),
+]
+
+# (link field value as sent, normalized link objects)
+LINK_CASES = [
+    ("https://example.com", [{"original_url": "https://example.com"}]),
+    (
+        {"original_url": "https://example.com"},
+        [{"original_url": "https://example.com"}],
+    ),
+    (
+        ["https://example1.com", {"original_url": "https://example2.com"}],
+        [
+            {"original_url": "https://example1.com"},
+            {"original_url": "https://example2.com"},
+        ],
+    ),
+]
+
+# (pages returned by successive items.list calls, expected item IDs)
+ITER_ALL_ITEMS_CASES = [
+    (
+        [
+            {
+                "ok": True,
+                "items": [
+                    {"id": "Rec1", "fields": []},
+                    {"id": "Rec2", "fields": []},
+                ],
+                "response_metadata": {"next_cursor": ""},
+            },
+        ],
+        ["Rec1", "Rec2"],
+    ),
+    (
+        [
+            {
+                "ok": True,
+                "items": [{"id": "Rec1"}, {"id": "Rec2"}],
+                "response_metadata": {"next_cursor": "cursor_page_2"},
+            },
+            {
+                "ok": True,
+                "items": [{"id": "Rec3"}, {"id": "Rec4"}],
+                "response_metadata": {"next_cursor": ""},
+            },
+        ],
+        ["Rec1", "Rec2", "Rec3", "Rec4"],
+    ),
+    (
+        [{"ok": True, "items": [], "response_metadata": {"next_cursor": ""}}],
+        [],
+    ),
+]
+
+
+def test_client_initialization():
+    """Test SlackListsClient initialization."""
+    # SLACK_BOT_TOKEN is set once for the whole session in conftest
+    client = SlackListsClient()
+    assert client.client is not None
 
 
 @pytest.mark.asyncio
-async def test_update_item(mock_slack_client):
-    """Test updating items in a list."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True},
+async def test_add_item(mock_slack_client, client):
+    """Test adding an item to a list."""
+    mock_slack_client.api_call = RecordingStub(_ADD_ITEM_RESPONSE)
+
+    result = await client.add_item(
+        list_id="F123",
+        initial_fields=[
+            {
+                "column_id": "Col123",
+                "rich_text": make_rich_text("Test Item"),
+            },
+        ],
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    assert result["id"] == "Rec123"
+    assert mock_slack_client.api_call.calls == [_ADD_ITEM_CALL]
+
+
+@pytest.mark.asyncio
+async def test_update_item(mock_slack_client, client):
+    """Test updating items in a list."""
+    mock_slack_client.api_call = RecordingStub(_OK_RESPONSE)
 
     result = await client.update_item(
         list_id="F123",
@@ -111,42 +285,39 @@ async def test_update_item(mock_slack_client):
     )
 
     assert result["success"] is True
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.update",
-        json={
-            "list_id": "F123",
-            "cells": [
-                {
-                    "row_id": "Rec123",
-                    "column_id": "Col123",
-                    "rich_text": [
-                        {
-                            "type": "rich_text",
-                            "elements": [
-                                {
-                                    "type": "rich_text_section",
-                                    "elements": [
-                                        {"type": "text", "text": "Updated Item"}
-                                    ],
-                                }
-                            ],
-                        }
-                    ],
-                },
-            ],
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.items.update",
+            "json": {
+                "list_id": "F123",
+                "cells": [
+                    {
+                        "row_id": "Rec123",
+                        "column_id": "Col123",
+                        "rich_text": [
+                            {
+                                "type": "rich_text",
+                                "elements": [
+                                    {
+                                        "type": "rich_text_section",
+                                        "elements": [
+                                            {"type": "text", "text": "Updated Item"},
+                                        ],
+                                    },
+                                ],
+                            },
+                        ],
+                    },
+                ],
+            },
         },
-    )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_delete_item(mock_slack_client):
+async def test_delete_item(mock_slack_client, client):
     """Test deleting an item from a list."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True},
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_OK_RESPONSE)
 
     result = await client.delete_item(
         list_id="F123",
@@ -155,17 +326,19 @@ async def test_delete_item(mock_slack_client):
 
     assert result["deleted"] is True
     assert result["item_id"] == "Rec123"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.delete",
-        json={"list_id": "F123", "id": "Rec123"},
-    )
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.items.delete",
+            "json": {"list_id": "F123", "id": "Rec123"},
+        },
+    ]
 
 
 @pytest.mark.asyncio
-async def test_get_item(mock_slack_client):
+async def test_get_item(mock_slack_client, client):
     """Test getting a specific item."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
+    mock_slack_client.api_call = RecordingStub(
+        {
             "ok": True,
             "record": {
                 "id": "Rec123",
@@ -174,12 +347,9 @@ async def test_get_item(mock_slack_client):
                 ],
             },
             "list": {"list_metadata": {"schema": []}},
-        },
+        }
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.get_item(
         list_id="F123",
         item_id="Rec123",
@@ -189,67 +359,45 @@ async def test_get_item(mock_slack_client):
     assert "item" in result
     assert result["item"]["id"] == "Rec123"
     # include_is_subscribed is not included when False
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.info",
-        json={"list_id": "F123", "id": "Rec123"},
-    )
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.items.info",
+            "json": {"list_id": "F123", "id": "Rec123"},
+        },
+    ]
 
 
 @pytest.mark.asyncio
-async def test_list_items_without_filters(mock_slack_client):
+async def test_list_items_without_filters(mock_slack_client, client):
     """Test listing items without filters."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
+    mock_slack_client.api_call = RecordingStub(
+        {
             "ok": True,
             "items": [
                 {"id": "Rec1", "fields": []},
                 {"id": "Rec2", "fields": []},
             ],
-        },
+        }
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.list_items(
         list_id="F123",
         limit=100,
     )
 
     assert len(result["items"]) == 2
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.list",
-        json={"list_id": "F123", "limit": 100},
-    )
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.items.list",
+            "json": {"list_id": "F123", "limit": 100},
+        },
+    ]
 
 
 @pytest.mark.asyncio
-async def test_list_items_with_filters(mock_slack_client):
+async def test_list_items_with_filters(mock_slack_client, client):
     """Test listing items with client-side filters."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "items": [
-                {
-                    "id": "Rec1",
-                    "fields": [
-                        {"key": "name", "text": "Test Item"},
-                        {"key": "status", "select": ["active"]},
-                    ],
-                },
-                {
-                    "id": "Rec2",
-                    "fields": [
-                        {"key": "name", "text": "Another Item"},
-                        {"key": "status", "select": ["inactive"]},
-                    ],
-                },
-            ],
-        },
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_FILTER_ITEMS_RESPONSE)
 
     result = await client.list_items(
         list_id="F123",
@@ -261,138 +409,164 @@ async def test_list_items_with_filters(mock_slack_client):
     assert len(result["items"]) == 1
     assert result["items"][0]["id"] == "Rec1"
 
-    # Should request more items when filtering
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.list",
-        json={"list_id": "F123", "limit": 300},  # 3x the requested limit
-    )
+    # A single page without a next cursor is fetched at the requested size
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.items.list",
+            "json": {"list_id": "F123", "limit": 100},
+        },
+    ]
 
 
 @pytest.mark.asyncio
-async def test_filter_matching_logic():
+async def test_list_items_with_filters_paginates(mock_slack_client, client):
+    """Test filtered listing follows the cursor until enough items match."""
+    mock_slack_client.api_call = RecordingStub(
+        responses=[
+            {
+                "ok": True,
+                "items": [
+                    {"id": "Rec1", "fields": [{"key": "name", "text": "Test 1"}]},
+                    {"id": "Rec2", "fields": [{"key": "name", "text": "Other"}]},
+                    {"id": "Rec3", "fields": [{"key": "name", "text": "Test 3"}]},
+                ],
+                "response_metadata": {"next_cursor": "cursor_page_2"},
+            },
+            {
+                "ok": True,
+                "items": [
+                    {"id": "Rec4", "fields": [{"key": "name", "text": "Test 4"}]},
+                    {"id": "Rec5", "fields": [{"key": "name", "text": "Test 5"}]},
+                ],
+                "response_metadata": {"next_cursor": "cursor_page_3"},
+            },
+        ],
+    )
+
+    result = await client.list_items(
+        list_id="F123",
+        limit=3,
+        filters={"name": {"contains": "Test"}},
+    )
+
+    assert [item["id"] for item in result["items"]] == ["Rec1", "Rec3", "Rec4"]
+    assert result["next_cursor"] == "cursor_page_3"
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.items.list",
+            "json": {"list_id": "F123", "limit": 3},
+        },
+        {
+            "api_method": "slackLists.items.list",
+            "json": {"list_id": "F123", "limit": 3, "cursor": "cursor_page_2"},
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    "case_id,filters,expected",
+    FILTER_CASES,
+    ids=[case[0] for case in FILTER_CASES],
+)
+def test_filter_matching_logic(client, case_id, filters, expected):
     """Test the filter matching logic directly."""
-    client = SlackListsClient()
+    assert client._matches_filters(FILTER_ITEM, filters) is expected
+    compiled = client._compile_filters(filters)
+    assert client._matches_filters(FILTER_ITEM, compiled) is expected
+
+
+def test_filter_matching_scales(client):
+    """Test compiled filters stay cheap across a large batch of items."""
+    items = [
+        {
+            "id": f"Rec{i}",
+            "fields": [
+                {"key": "status", "select": ["active" if i % 2 else "done"]},
+                {"key": "name", "text": f"Task {i}"},
+            ],
+        }
+        for i in range(10_000)
+    ]
+    compiled = client._compile_filters(
+        {"status": {"in": ["active"]}, "name": {"contains": "task"}},
+    )
+
+    start = time.perf_counter()
+    matched = sum(client._matches_filters(item, compiled) for item in items)
+    elapsed = time.perf_counter() - start
+
+    assert matched == 5_000
+    # Runs in a few tens of milliseconds; the bound only catches regressions
+    assert elapsed < 1.0
+
 
-    # Test equals operator
+def test_filter_matching_by_column_id(client):
+    """Test filters match fields by column_id as well as key."""
     item = {
         "fields": [
-            {"key": "status", "select": ["active"]},
-            {"key": "name", "text": "Test Item"},
+            {"column_id": "Col1", "key": "status", "select": ["active"]},
+            {"column_id": "Col2", "text": "Test Item"},
         ],
     }
 
+    assert client._matches_filters(item, {"Col1": {"equals": "active"}}) is True
     assert client._matches_filters(item, {"status": {"equals": "active"}}) is True
-    assert client._matches_filters(item, {"status": {"equals": "inactive"}}) is False
+    assert client._matches_filters(item, {"Col2": {"contains": "test"}}) is True
+    assert client._matches_filters(item, {"missing": {"equals": "active"}}) is False
 
-    # Test contains operator
-    assert client._matches_filters(item, {"name": {"contains": "Test"}}) is True
-    assert (
-        client._matches_filters(item, {"name": {"contains": "test"}}) is True
-    )  # Case-insensitive
-    assert client._matches_filters(item, {"name": {"contains": "Other"}}) is False
-
-    # Test not_equals operator
-    assert client._matches_filters(item, {"status": {"not_equals": "inactive"}}) is True
-    assert client._matches_filters(item, {"status": {"not_equals": "active"}}) is False
 
-    # Test not_contains operator
-    assert client._matches_filters(item, {"name": {"not_contains": "Other"}}) is True
-    assert client._matches_filters(item, {"name": {"not_contains": "Test"}}) is False
-
-    # Test in operator
-    assert (
-        client._matches_filters(item, {"status": {"in": ["active", "pending"]}}) is True
-    )
-    assert (
-        client._matches_filters(item, {"status": {"in": ["inactive", "pending"]}})
-        is False
+def test_compile_condition(client):
+    """Test filter conditions are precompiled for reuse across items."""
+    compiled = client._compile_condition(
+        {"contains": "TeSt", "in": ["active", "pending"], "equals": "x"},
     )
 
-    # Test not_in operator
-    assert (
-        client._matches_filters(item, {"status": {"not_in": ["inactive", "pending"]}})
-        is True
-    )
-    assert (
-        client._matches_filters(item, {"status": {"not_in": ["active", "pending"]}})
-        is False
-    )
+    assert [c.operator for c in compiled] == ["contains", "in", "equals"]
+    assert compiled[0].search_lower == "test"
+    assert compiled[1].expected_set == frozenset({"active", "pending"})
+    assert compiled[2].expected_set is None
 
-    # Test multiple filters (AND logic)
+    # Unknown operators are dropped at compile time
+    assert client._compile_condition({"unknown": "x"}) == ()
+
+    # Compiled conditions behave the same as raw ones
+    item = {"fields": [{"key": "status", "select": ["active"]}]}
     assert (
         client._matches_filters(
-            item,
-            {
-                "status": {"equals": "active"},
-                "name": {"contains": "Test"},
-            },
+            item, {"status": client._compile_condition({"in": ["active"]})}
         )
         is True
     )
-
     assert (
         client._matches_filters(
-            item,
-            {
-                "status": {"equals": "active"},
-                "name": {"contains": "Other"},
-            },
+            item, {"status": client._compile_condition({"not_in": ["active"]})}
         )
         is False
     )
 
+    # Unhashable values fall back to an equality scan
+    link_item = {"fields": [{"key": "link", "link": [{"original_url": "a"}]}]}
+    assert (
+        client._matches_filters(link_item, {"link": {"in": [{"original_url": "a"}]}})
+        is True
+    )
 
-@pytest.mark.asyncio
-async def test_field_value_extraction():
-    """Test the field value extraction logic."""
-    client = SlackListsClient()
-
-    # Test checkbox field
-    field = {"checkbox": True}
-    assert client._extract_field_value(field) is True
-
-    # Test select field
-    field = {"select": ["option1"]}
-    assert client._extract_field_value(field) == ["option1"]
-
-    # Test user field
-    field = {"user": ["U123"]}
-    assert client._extract_field_value(field) == ["U123"]
-
-    # Test date field
-    field = {"date": ["2024-01-01"]}
-    assert client._extract_field_value(field) == ["2024-01-01"]
-
-    # Test text field
-    field = {"text": "Test Text"}
-    assert client._extract_field_value(field) == "Test Text"
-
-    # Test number field
-    field = {"number": [42]}
-    assert client._extract_field_value(field) == [42]
-
-    # Test email field
-    field = {"email": ["test@example.com"]}
-    assert client._extract_field_value(field) == ["test@example.com"]
-
-    # Test phone field
-    field = {"phone": ["+1234567890"]}
-    assert client._extract_field_value(field) == ["+1234567890"]
-
-    # Test fallback to value field
-    field = {"value": "fallback"}
-    assert client._extract_field_value(field) == "fallback"
 
-    # Test empty field
-    field = {}
-    assert client._extract_field_value(field) is None
+@pytest.mark.parametrize(
+    "field,expected",
+    FIELD_VALUE_CASES,
+    ids=[next(iter(case[0]), "empty") for case in FIELD_VALUE_CASES],
+)
+def test_field_value_extraction(client, field, expected):
+    """Test the field value extraction logic."""
+    assert client._extract_field_value(field) == expected
 
 
 @pytest.mark.asyncio
-async def test_get_list(mock_slack_client):
+async def test_get_list(mock_slack_client, client):
     """Test getting list information."""
-    mock_slack_client.api_call = MagicMock(
-        side_effect=[
+    mock_slack_client.api_call = RecordingStub(
+        responses=[
             # First call: items.list
             {
                 "ok": True,
@@ -410,55 +584,65 @@ async def test_get_list(mock_slack_client):
         ],
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.get_list(list_id="F123")
 
     assert result["id"] == "F123"
     assert result["name"] == "Test List"
-    assert mock_slack_client.api_call.call_count == 2
+    assert len(mock_slack_client.api_call.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_list_metadata_in_envelope(mock_slack_client, client):
+    """Test get_list skips items.info when items.list includes list metadata."""
+    mock_slack_client.api_call = RecordingStub(
+        {
+            "ok": True,
+            "items": [{"id": "Rec1"}],
+            "list": {"id": "F123", "name": "Test List"},
+        }
+    )
+
+    result = await client.get_list(list_id="F123")
+
+    assert result["name"] == "Test List"
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.items.list",
+            "json": {"list_id": "F123", "limit": 1},
+        },
+    ]
 
 
 @pytest.mark.asyncio
-async def test_get_list_empty(mock_slack_client):
+async def test_get_list_empty(mock_slack_client, client):
     """Test getting list information when list is empty."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
+    mock_slack_client.api_call = RecordingStub(
+        {
             "ok": True,
             "items": [],
-        },
+        }
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.get_list(list_id="F123")
 
     assert result["id"] == "F123"
     assert "message" in result
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.list",
-        json={"list_id": "F123", "limit": 1},
-    )
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.items.list",
+            "json": {"list_id": "F123", "limit": 1},
+        },
+    ]
 
 
 @pytest.mark.asyncio
-async def test_error_handling(mock_slack_client):
+async def test_error_handling(mock_slack_client, client):
     """Test error handling for API failures."""
-    mock_response = MagicMock()
-    # Create proper response data
-    mock_response.data = {
-        "ok": False,
-        "error": "list_not_found",
-        "error_message": "List not found",
-    }
-    # Ensure get() returns actual string values, not MagicMock
-    mock_response.get = lambda key, default=None: {
-        "error": "list_not_found",
-        "error_message": "List not found",
-        "ok": False,
-    }.get(key, default)
+    mock_response = _Resp(
+        ok=False,
+        error="list_not_found",
+        error_message="List not found",
+    )
 
     mock_slack_client.api_call = MagicMock(
         side_effect=SlackApiError(
@@ -467,9 +651,6 @@ async def test_error_handling(mock_slack_client):
         ),
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     with pytest.raises(Exception) as exc_info:
         await client.add_item(
             list_id="F123",
@@ -479,54 +660,55 @@ async def test_error_handling(mock_slack_client):
     # Check for human-readable error message
     assert "List not found" in str(exc_info.value)
 
+    # The typed error is preserved for callers that want structured handling
+    assert isinstance(exc_info.value, SlackApiError)
+    assert exc_info.value.error_response.error_code == "list_not_found"
+    assert isinstance(exc_info.value.__cause__, SlackApiError)
+
 
 @pytest.mark.asyncio
-async def test_create_list_with_todo_mode(mock_slack_client):
+async def test_create_list_with_todo_mode(mock_slack_client, client):
     """Test creating a list with todo mode enabled."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
+    mock_slack_client.api_call = RecordingStub(
+        {
             "ok": True,
             "list": {
                 "id": "F123",
                 "name": "My Tasks",
             },
-        },
+        }
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.create_list(
         name="My Tasks",
         todo_mode=True,
     )
 
     assert result["id"] == "F123"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.create",
-        json={
-            "name": "My Tasks",
-            "todo_mode": True,
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.create",
+            "json": {
+                "name": "My Tasks",
+                "todo_mode": True,
+            },
         },
-    )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_create_list_with_schema(mock_slack_client):
+async def test_create_list_with_schema(mock_slack_client, client):
     """Test creating a list with custom schema."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
+    mock_slack_client.api_call = RecordingStub(
+        {
             "ok": True,
             "list": {
                 "id": "F123",
                 "name": "Custom List",
             },
-        },
+        }
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     schema = [
         {"key": "task", "name": "Task", "type": "text", "is_primary_column": True},
         {"key": "status", "name": "Status", "type": "select"},
@@ -538,55 +720,51 @@ async def test_create_list_with_schema(mock_slack_client):
     )
 
     assert result["id"] == "F123"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.create",
-        json={
-            "name": "Custom List",
-            "schema": schema,
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.create",
+            "json": {
+                "name": "Custom List",
+                "schema": schema,
+            },
         },
-    )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_create_list_copy_from_existing(mock_slack_client):
+async def test_create_list_copy_from_existing(mock_slack_client, client):
     """Test duplicating an existing list."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
+    mock_slack_client.api_call = RecordingStub(
+        {
             "ok": True,
             "list": {
                 "id": "F456",
                 "name": "Copied List",
             },
-        },
+        }
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.create_list(
         copy_from_list_id="F123",
         include_copied_list_records=True,
     )
 
     assert result["id"] == "F456"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.create",
-        json={
-            "copy_from_list_id": "F123",
-            "include_copied_list_records": True,
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.create",
+            "json": {
+                "copy_from_list_id": "F123",
+                "include_copied_list_records": True,
+            },
         },
-    )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_set_access_for_users(mock_slack_client):
+async def test_set_access_for_users(mock_slack_client, client):
     """Test setting access for users."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True},
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_OK_RESPONSE)
 
     result = await client.set_access(
         list_id="F123",
@@ -595,25 +773,22 @@ async def test_set_access_for_users(mock_slack_client):
     )
 
     assert result["success"] is True
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.access.set",
-        json={
-            "list_id": "F123",
-            "access_level": "write",
-            "user_ids": ["U123", "U456"],
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.access.set",
+            "json": {
+                "list_id": "F123",
+                "access_level": "write",
+                "user_ids": ["U123", "U456"],
+            },
         },
-    )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_set_access_for_channels(mock_slack_client):
+async def test_set_access_for_channels(mock_slack_client, client):
     """Test setting access for channels."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True},
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_OK_RESPONSE)
 
     result = await client.set_access(
         list_id="F123",
@@ -622,22 +797,78 @@ async def test_set_access_for_channels(mock_slack_client):
     )
 
     assert result["success"] is True
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.access.set",
-        json={
-            "list_id": "F123",
-            "access_level": "read",
-            "channel_ids": ["C123"],
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.access.set",
+            "json": {
+                "list_id": "F123",
+                "access_level": "read",
+                "channel_ids": ["C123"],
+            },
         },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_set_access_batches_large_grants(mock_slack_client, client):
+    """Test set_access splits large user lists into batches."""
+    mock_slack_client.api_call = RecordingStub(_OK_RESPONSE)
+    client.bulk_batch_size = 2
+    client.bulk_concurrency = 2
+
+    user_ids = ["U1", "U2", "U3", "U4", "U5"]
+    result = await client.set_access(
+        list_id="F123",
+        access_level="read",
+        user_ids=user_ids,
     )
 
+    assert result["success"] is True
+    calls = mock_slack_client.api_call.calls
+    assert len(calls) == 3
+    sent = [call["json"]["user_ids"] for call in calls]
+    assert sorted(sent) == [["U1", "U2"], ["U3", "U4"], ["U5"]]
+    for call in calls:
+        assert call["json"]["access_level"] == "read"
+
 
+@pytest.mark.parametrize("raises", [False, True])
 @pytest.mark.asyncio
-async def test_set_access_validation_errors(mock_slack_client):
-    """Test set_access validation errors."""
-    client = SlackListsClient()
-    client.client = mock_slack_client
+async def test_set_access_reports_partial_batch_failure(
+    mock_slack_client, client, raises
+):
+    """Test a failed middle batch leaves the others applied and is reported."""
+    failure = _Resp(ok=False, error="user_not_found")
+
+    def api_call(**kwargs):
+        if kwargs["json"]["user_ids"] != ["U3", "U4"]:
+            return _OK_RESPONSE
+        if raises:
+            raise SlackApiError(message="user_not_found", response=failure)
+        return failure
+
+    mock_slack_client.api_call = MagicMock(side_effect=api_call)
+    client.bulk_batch_size = 2
+    client.bulk_concurrency = 1
+
+    with pytest.raises(SlackListsBatchError) as exc_info:
+        await client.set_access(
+            list_id="F123",
+            access_level="read",
+            user_ids=["U1", "U2", "U3", "U4", "U5"],
+        )
 
+    error = exc_info.value
+    assert mock_slack_client.api_call.call_count == 3
+    assert error.succeeded_ids == ["U1", "U2", "U5"]
+    assert error.failed_ids == ["U3", "U4"]
+    assert error.error_response.error_code == "user_not_found"
+    assert "succeeded: U1, U2, U5; failed: U3, U4" in str(error)
+
+
+@pytest.mark.asyncio
+async def test_set_access_validation_errors(client):
+    """Test set_access validation errors."""
     # Neither user_ids nor channel_ids provided
     with pytest.raises(ValueError) as exc_info:
         await client.set_access(list_id="F123", access_level="read")
@@ -673,14 +904,9 @@ async def test_set_access_validation_errors(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_delete_access_for_users(mock_slack_client):
+async def test_delete_access_for_users(mock_slack_client, client):
     """Test deleting access for users."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True},
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_OK_RESPONSE)
 
     result = await client.delete_access(
         list_id="F123",
@@ -688,21 +914,20 @@ async def test_delete_access_for_users(mock_slack_client):
     )
 
     assert result["success"] is True
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.access.delete",
-        json={
-            "list_id": "F123",
-            "user_ids": ["U123", "U456"],
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.access.delete",
+            "json": {
+                "list_id": "F123",
+                "user_ids": ["U123", "U456"],
+            },
         },
-    )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_delete_access_validation_errors(mock_slack_client):
+async def test_delete_access_validation_errors(client):
     """Test delete_access validation errors."""
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     # Neither user_ids nor channel_ids provided
     with pytest.raises(ValueError) as exc_info:
         await client.delete_access(list_id="F123")
@@ -719,18 +944,15 @@ async def test_delete_access_validation_errors(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_start_export(mock_slack_client):
+async def test_start_export(mock_slack_client, client):
     """Test starting a list export job."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
+    mock_slack_client.api_call = RecordingStub(
+        {
             "ok": True,
             "job_id": "LeF123456",
-        },
+        }
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.start_export(
         list_id="F123",
         include_archived=True,
@@ -738,28 +960,27 @@ async def test_start_export(mock_slack_client):
 
     assert result["job_id"] == "LeF123456"
     assert result["status"] == "started"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.download.start",
-        json={
-            "list_id": "F123",
-            "include_archived": True,
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.download.start",
+            "json": {
+                "list_id": "F123",
+                "include_archived": True,
+            },
         },
-    )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_get_export_url_completed(mock_slack_client):
+async def test_get_export_url_completed(mock_slack_client, client):
     """Test getting export URL when job is completed."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
+    mock_slack_client.api_call = RecordingStub(
+        {
             "ok": True,
             "download_url": "https://files.slack.com/download/...",
-        },
+        }
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.get_export_url(
         list_id="F123",
         job_id="LeF123456",
@@ -767,28 +988,27 @@ async def test_get_export_url_completed(mock_slack_client):
 
     assert result["download_url"] == "https://files.slack.com/download/..."
     assert result["status"] == "completed"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.download.get",
-        json={
-            "list_id": "F123",
-            "job_id": "LeF123456",
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.download.get",
+            "json": {
+                "list_id": "F123",
+                "job_id": "LeF123456",
+            },
         },
-    )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_get_export_url_processing(mock_slack_client):
+async def test_get_export_url_processing(mock_slack_client, client):
     """Test getting export URL when job is still processing."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
+    mock_slack_client.api_call = RecordingStub(
+        {
             "ok": True,
             "download_url": None,
-        },
+        }
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.get_export_url(
         list_id="F123",
         job_id="LeF123456",
@@ -799,19 +1019,16 @@ async def test_get_export_url_processing(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_wait_for_export_success(mock_slack_client):
+async def test_wait_for_export_success(mock_slack_client, client):
     """Test waiting for export to complete successfully."""
     # First call returns processing, second returns completed
-    mock_slack_client.api_call = MagicMock(
-        side_effect=[
-            {"ok": True, "download_url": None},
-            {"ok": True, "download_url": "https://files.slack.com/export.csv"},
+    mock_slack_client.api_call = RecordingStub(
+        responses=[
+            _EXPORT_PENDING_RESPONSE,
+            _EXPORT_READY_RESPONSE,
         ],
     )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     result = await client.wait_for_export(
         list_id="F123",
         job_id="LeF123456",
@@ -821,21 +1038,13 @@ async def test_wait_for_export_success(mock_slack_client):
 
     assert result["download_url"] == "https://files.slack.com/export.csv"
     assert result["status"] == "completed"
-    assert mock_slack_client.api_call.call_count == 2
+    assert len(mock_slack_client.api_call.calls) == 2
 
 
 @pytest.mark.asyncio
-async def test_wait_for_export_immediate_success(mock_slack_client):
+async def test_wait_for_export_immediate_success(mock_slack_client, client):
     """Test wait_for_export when export is already complete."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "download_url": "https://files.slack.com/export.csv",
-        },
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_EXPORT_READY_RESPONSE)
 
     result = await client.wait_for_export(
         list_id="F123",
@@ -844,18 +1053,13 @@ async def test_wait_for_export_immediate_success(mock_slack_client):
 
     assert result["download_url"] == "https://files.slack.com/export.csv"
     assert result["status"] == "completed"
-    assert mock_slack_client.api_call.call_count == 1
+    assert len(mock_slack_client.api_call.calls) == 1
 
 
 @pytest.mark.asyncio
-async def test_wait_for_export_timeout(mock_slack_client):
+async def test_wait_for_export_timeout(mock_slack_client, client):
     """Test wait_for_export times out when export never completes."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True, "download_url": None},
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_EXPORT_PENDING_RESPONSE)
 
     with pytest.raises(TimeoutError) as exc_info:
         await client.wait_for_export(
@@ -870,14 +1074,115 @@ async def test_wait_for_export_timeout(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_update_list(mock_slack_client):
-    """Test updating list properties."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True},
+async def test_wait_for_export_zero_timeout_checks_once(mock_slack_client, client):
+    """Test a zero timeout still finishes one status check first."""
+    mock_slack_client.api_call = RecordingStub(_EXPORT_READY_RESPONSE)
+
+    result = await client.wait_for_export(list_id="F123", job_id="LeF123456", timeout=0)
+
+    assert result["status"] == "completed"
+    assert len(mock_slack_client.api_call.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_export_restores_poll_interval(mock_slack_client, client):
+    """Test the shared poll interval follows the waiters that remain."""
+    mock_slack_client.api_call = RecordingStub(_EXPORT_PENDING_RESPONSE)
+    poller = client._export_poller
+
+    slow = asyncio.ensure_future(
+        client.wait_for_export(
+            list_id="F123", job_id="LeSlow", timeout=10, poll_interval=5
+        )
     )
+    with pytest.raises(TimeoutError) as exc_info:
+        await client.wait_for_export(
+            list_id="F123", job_id="LeFast", timeout=0, poll_interval=0.01
+        )
 
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    assert "Last status: processing" in str(exc_info.value)
+    assert poller._poll_interval == 5
+
+    slow.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await slow
+    assert poller._poll_interval is None
+
+
+@pytest.mark.asyncio
+async def test_wait_for_export_wakes_sleeping_loop(mock_slack_client, client):
+    """Test a waiter joining mid-sleep is polled without waiting it out."""
+    calls = []
+
+    def api_call(**kwargs):
+        calls.append(kwargs["json"]["job_id"])
+        if kwargs["json"]["job_id"] == "LeFast":
+            return _EXPORT_READY_RESPONSE
+        return _EXPORT_PENDING_RESPONSE
+
+    mock_slack_client.api_call = api_call
+
+    slow = asyncio.ensure_future(
+        client.wait_for_export(
+            list_id="F123", job_id="LeSlow", timeout=10, poll_interval=5
+        )
+    )
+    # Let the shared loop finish its first tick and start its 5 second sleep
+    while not calls:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    result = await client.wait_for_export(
+        list_id="F123", job_id="LeFast", timeout=0.05, poll_interval=0.01
+    )
+
+    assert result["status"] == "completed"
+    assert time.perf_counter() - start < 1.0
+
+    slow.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await slow
+
+
+@pytest.mark.asyncio
+async def test_wait_for_export_shares_polling(mock_slack_client, client):
+    """Test concurrent waits on the same job share each status poll."""
+    mock_slack_client.api_call = RecordingStub(
+        responses=[
+            _EXPORT_PENDING_RESPONSE,
+            _EXPORT_READY_RESPONSE,
+        ],
+    )
+
+    results = await asyncio.gather(
+        client.wait_for_export(
+            list_id="F123", job_id="LeF123456", timeout=10, poll_interval=0.01
+        ),
+        client.wait_for_export(
+            list_id="F123", job_id="LeF123456", timeout=10, poll_interval=0.01
+        ),
+    )
+
+    assert [r["status"] for r in results] == ["completed", "completed"]
+    assert len(mock_slack_client.api_call.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for_export_propagates_errors(mock_slack_client, client):
+    """Test wait_for_export raises when polling the export fails."""
+    mock_slack_client.api_call = RecordingStub({"ok": False, "error": "list_not_found"})
+
+    with pytest.raises(Exception) as exc_info:
+        await client.wait_for_export(list_id="F123", job_id="LeF123456")
+
+    assert "Failed to get export URL" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_update_list(mock_slack_client, client):
+    """Test updating list properties."""
+    mock_slack_client.api_call = RecordingStub(_OK_RESPONSE)
 
     result = await client.update_list(
         list_id="F123",
@@ -887,19 +1192,16 @@ async def test_update_list(mock_slack_client):
     )
 
     assert result["success"] is True
-    call_args = mock_slack_client.api_call.call_args
-    assert call_args[1]["api_method"] == "slackLists.update"
-    assert call_args[1]["json"]["id"] == "F123"
-    assert call_args[1]["json"]["name"] == "New Name"
-    assert call_args[1]["json"]["todo_mode"] is True
+    call_args = mock_slack_client.api_call.calls[-1]
+    assert call_args["api_method"] == "slackLists.update"
+    assert call_args["json"]["id"] == "F123"
+    assert call_args["json"]["name"] == "New Name"
+    assert call_args["json"]["todo_mode"] is True
 
 
 @pytest.mark.asyncio
-async def test_update_list_validation_error(mock_slack_client):
+async def test_update_list_validation_error(client):
     """Test update_list requires at least one field."""
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     with pytest.raises(ValueError) as exc_info:
         await client.update_list(list_id="F123")
     assert "At least one of name, description, or todo_mode must be provided" in str(
@@ -908,40 +1210,26 @@ async def test_update_list_validation_error(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_delete_list(mock_slack_client):
+async def test_delete_list(mock_slack_client, client):
     """Test deleting an entire list."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True},
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_OK_RESPONSE)
 
     result = await client.delete_list(list_id="F123")
 
     assert result["deleted"] is True
     assert result["list_id"] == "F123"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.delete",
-        json={"id": "F123"},
-    )
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.delete",
+            "json": {"id": "F123"},
+        },
+    ]
 
 
 @pytest.mark.asyncio
-async def test_add_item_with_duplication(mock_slack_client):
+async def test_add_item_with_duplication(mock_slack_client, client):
     """Test adding an item by duplicating an existing one."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "item": {
-                "id": "Rec456",
-                "list_id": "F123",
-            },
-        },
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_CREATED_ITEM_RESPONSE)
 
     result = await client.add_item(
         list_id="F123",
@@ -949,30 +1237,21 @@ async def test_add_item_with_duplication(mock_slack_client):
     )
 
     assert result["id"] == "Rec456"
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.create",
-        json={
-            "list_id": "F123",
-            "duplicated_item_id": "Rec123",
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.items.create",
+            "json": {
+                "list_id": "F123",
+                "duplicated_item_id": "Rec123",
+            },
         },
-    )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_add_item_with_parent(mock_slack_client):
+async def test_add_item_with_parent(mock_slack_client, client):
     """Test adding an item as a subtask."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "item": {
-                "id": "Rec456",
-                "list_id": "F123",
-            },
-        },
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_CREATED_ITEM_RESPONSE)
 
     result = await client.add_item(
         list_id="F123",
@@ -981,16 +1260,13 @@ async def test_add_item_with_parent(mock_slack_client):
     )
 
     assert result["id"] == "Rec456"
-    call_args = mock_slack_client.api_call.call_args
-    assert call_args[1]["json"]["parent_item_id"] == "Rec123"
+    call_args = mock_slack_client.api_call.calls[-1]
+    assert call_args["json"]["parent_item_id"] == "Rec123"
 
 
 @pytest.mark.asyncio
-async def test_add_item_validation_errors(mock_slack_client):
+async def test_add_item_validation_errors(client):
     """Test add_item validation errors."""
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     # Neither initial_fields nor duplicated_item_id provided
     with pytest.raises(ValueError) as exc_info:
         await client.add_item(list_id="F123")
@@ -1000,14 +1276,9 @@ async def test_add_item_validation_errors(mock_slack_client):
 
 
 @pytest.mark.asyncio
-async def test_delete_items_batch(mock_slack_client):
+async def test_delete_items_batch(mock_slack_client, client):
     """Test deleting multiple items at once."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={"ok": True},
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+    mock_slack_client.api_call = RecordingStub(_OK_RESPONSE)
 
     result = await client.delete_items(
         list_id="F123",
@@ -1016,127 +1287,49 @@ async def test_delete_items_batch(mock_slack_client):
 
     assert result["deleted"] is True
     assert result["count"] == 3
-    mock_slack_client.api_call.assert_called_once_with(
-        api_method="slackLists.items.deleteMultiple",
-        json={
-            "list_id": "F123",
-            "ids": ["Rec1", "Rec2", "Rec3"],
+    assert mock_slack_client.api_call.calls == [
+        {
+            "api_method": "slackLists.items.deleteMultiple",
+            "json": {
+                "list_id": "F123",
+                "ids": ["Rec1", "Rec2", "Rec3"],
+            },
         },
-    )
+    ]
 
 
 @pytest.mark.asyncio
-async def test_delete_items_validation_error(mock_slack_client):
+async def test_delete_items_validation_error(client):
     """Test delete_items requires at least one item."""
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
     with pytest.raises(ValueError) as exc_info:
         await client.delete_items(list_id="F123", item_ids=[])
     assert "At least one item ID must be provided" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
-async def test_link_field_normalization():
+@pytest.mark.parametrize(
+    "link_in,expected",
+    LINK_CASES,
+    ids=["str", "dict", "mixed_list"],
+)
+def test_link_field_normalization(client, link_in, expected):
     """Test link field normalization."""
-    client = SlackListsClient()
-
-    # Test string URL normalization
-    fields = [{"column_id": "Col1", "link": "https://example.com"}]
-    normalized = client._normalize_fields(fields)
-    assert normalized[0]["link"] == [{"original_url": "https://example.com"}]
-
-    # Test dict normalization
-    fields = [{"column_id": "Col1", "link": {"original_url": "https://example.com"}}]
-    normalized = client._normalize_fields(fields)
-    assert normalized[0]["link"] == [{"original_url": "https://example.com"}]
-
-    # Test mixed list normalization
-    fields = [
-        {
-            "column_id": "Col1",
-            "link": [
-                "https://example1.com",
-                {"original_url": "https://example2.com"},
-            ],
-        }
-    ]
+    fields = [{"column_id": "Col1", "link": link_in}]
     normalized = client._normalize_fields(fields)
-    assert normalized[0]["link"] == [
-        {"original_url": "https://example1.com"},
-        {"original_url": "https://example2.com"},
-    ]
-
-
-@pytest.mark.asyncio
-async def test_iter_all_items_single_page(mock_slack_client):
-    """Test iterating items when all fit in one page."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "items": [
-                {"id": "Rec1", "fields": []},
-                {"id": "Rec2", "fields": []},
-            ],
-            "response_metadata": {"next_cursor": ""},
-        },
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
-    items = [item async for item in client.iter_all_items("F123")]
-
-    assert len(items) == 2
-    assert items[0]["id"] == "Rec1"
-    assert items[1]["id"] == "Rec2"
-    mock_slack_client.api_call.assert_called_once()
+    assert normalized[0]["link"] == expected
+    assert client._normalize_link(link_in) == expected
 
 
 @pytest.mark.asyncio
-async def test_iter_all_items_multiple_pages(mock_slack_client):
-    """Test iterating items across multiple pages."""
-    # Setup mock to return two pages
-    mock_slack_client.api_call = MagicMock(
-        side_effect=[
-            {
-                "ok": True,
-                "items": [{"id": "Rec1"}, {"id": "Rec2"}],
-                "response_metadata": {"next_cursor": "cursor_page_2"},
-            },
-            {
-                "ok": True,
-                "items": [{"id": "Rec3"}, {"id": "Rec4"}],
-                "response_metadata": {"next_cursor": ""},
-            },
-        ],
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
+@pytest.mark.parametrize(
+    "pages,expected_ids",
+    ITER_ALL_ITEMS_CASES,
+    ids=["single_page", "multiple_pages", "empty_list"],
+)
+async def test_iter_all_items(mock_slack_client, client, pages, expected_ids):
+    """Test iterating items across however many pages the API returns."""
+    mock_slack_client.api_call = RecordingStub(responses=pages)
 
     items = [item async for item in client.iter_all_items("F123", limit=2)]
 
-    assert len(items) == 4
-    assert [item["id"] for item in items] == ["Rec1", "Rec2", "Rec3", "Rec4"]
-    assert mock_slack_client.api_call.call_count == 2
-
-
-@pytest.mark.asyncio
-async def test_iter_all_items_empty_list(mock_slack_client):
-    """Test iterating an empty list."""
-    mock_slack_client.api_call = MagicMock(
-        return_value={
-            "ok": True,
-            "items": [],
-            "response_metadata": {"next_cursor": ""},
-        },
-    )
-
-    client = SlackListsClient()
-    client.client = mock_slack_client
-
-    items = [item async for item in client.iter_all_items("F123")]
-
-    assert len(items) == 0
-    mock_slack_client.api_call.assert_called_once()
+    assert [item["id"] for item in items] == expected_ids
+    assert len(mock_slack_client.api_call.calls) == len(pages)
@@ -1,18 +1,18 @@
 """Tests for validation error handling."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
+from pydantic import ValidationError
+
+from slack_lists_mcp.config import Settings
 from slack_lists_mcp.slack_client import SlackListsClient
 
 
 @pytest.fixture
 def mock_slack_client():
     """Create a mock Slack client."""
-    with patch("slack_lists_mcp.slack_client.WebClient") as mock:
-        mock_instance = MagicMock()
-        mock.return_value = mock_instance
-        yield mock_instance
+    return MagicMock()
 
 
 @pytest.mark.asyncio
@@ -76,3 +76,13 @@ async def test_validation_success_with_valid_fields(mock_slack_client):
     )
 
     assert result["id"] == "Rec123"
+
+
+@pytest.mark.parametrize("env_var", ["SLACK_BULK_BATCH_SIZE", "SLACK_BULK_CONCURRENCY"])
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_bulk_settings_must_be_positive(monkeypatch, env_var, value):
+    """Test bulk batch size and concurrency reject values below 1."""
+    monkeypatch.setenv(env_var, value)
+
+    with pytest.raises(ValidationError):
+        Settings()